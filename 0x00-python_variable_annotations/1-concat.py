@@ -1,7 +1,43 @@
 #!/usr/bin/env python3
 """Type-annotated function concat"""
+from contextlib import contextmanager
+from itertools import chain, repeat
+from operator import add
+from typing import IO, Iterable, Iterator, List, Optional, TextIO, Union
+import io
 
 
 def concat(str1: str, str2: str) -> str:
     """Takes two str variables and returns their concatenation"""
     return str1 + str2
+
+
+@contextmanager
+def text_sink(out: IO, encoding: str = "utf-8") -> Iterator[TextIO]:
+    """Yields a text stream writing to out; binary streams (BytesIO,
+    sockets' makefile('wb'), ...) are wrapped for the duration of the
+    block and left open afterwards"""
+    if isinstance(out, io.TextIOBase):
+        yield out
+        return
+    wrapper = io.TextIOWrapper(out, encoding=encoding, write_through=True)
+    try:
+        yield wrapper
+    finally:
+        wrapper.flush()
+        wrapper.detach()
+
+
+def concat_many(a_list: Iterable[str], b_list: Iterable[str],
+                out: Optional[IO] = None, sep: str = "\n",
+                encoding: str = "utf-8") -> Union[List[str], IO]:
+    """Pairwise concat of two iterables of str.
+    Without out, returns the list of concatenations. With a text or
+    binary stream, writes every pair followed by sep straight to it, so
+    no concatenated string is ever built, and returns out."""
+    if out is None:
+        return list(map(add, a_list, b_list))
+    with text_sink(out, encoding) as stream:
+        stream.writelines(chain.from_iterable(
+            zip(a_list, b_list, repeat(sep))))
+    return out
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """Defines duck typed function"""
-from typing import Any, Sequence, Union
+from typing import Any, Iterable, List, Sequence, Union
 
 
 def safe_first_element(lst: Sequence[Any]) -> Union[Any, None]:
@@ -9,3 +9,8 @@ def safe_first_element(lst: Sequence[Any]) -> Union[Any, None]:
         return lst[0]
     else:
         return None
+
+
+def first_elements(seqs: Iterable[Sequence[Any]]) -> List[Union[Any, None]]:
+    """safe_first_element of every sequence, in one pass"""
+    return [lst[0] if lst else None for lst in seqs]
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Advanced type annotated function"""
-from typing import Any, Mapping, TypeVar, Union
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Mapping, TypeVar, Union
 T = TypeVar('T')
+_MISSING = object()
 
 
 def safely_get_value(dct: Mapping, key: Any, default: Union[T, None]
@@ -11,3 +13,21 @@ def safely_get_value(dct: Mapping, key: Any, default: Union[T, None]
         return dct[key]
     else:
         return default
+
+
+def safely_get_many(dct: Mapping, keys: Iterable[Any],
+                    default: Union[T, None] = None) -> List[Union[Any, T]]:
+    """Bulk safely_get_value: one lookup per key in a single pass.
+    Plain dicts go through dict.get in C; other mappings are probed at
+    most once per distinct key, so expensive or lazily loaded mappings
+    are not hit again for repeated keys."""
+    if type(dct) is dict:
+        return list(map(dct.get, keys, repeat(default)))
+    seen: Dict[Any, Any] = {}
+    values: List[Union[Any, T]] = []
+    for key in keys:
+        value = seen.get(key, _MISSING)
+        if value is _MISSING:
+            value = seen[key] = dct.get(key, default)
+        values.append(value)
+    return values
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Defines Type checking"""
-from typing import List, Tuple
+from array import array as buffer_array
+from itertools import chain, repeat
+from typing import Any, Iterator, List, Sequence, Tuple, Union
+import sys
 
 
 def zoom_array(lst: Tuple, factor: int = 2) -> List:
@@ -12,8 +15,64 @@ def zoom_array(lst: Tuple, factor: int = 2) -> List:
     return zoomed_in
 
 
-array = (12, 72, 91)
+class ZoomView(Sequence):
+    """Lazy, read-only equivalent of zoom_array(lst, factor): every item
+    is computed from lst on access and nothing is copied"""
+    __slots__ = ('_lst', '_factor')
 
-zoom_2x = zoom_array(array)
+    def __init__(self, lst: Sequence, factor: int = 2) -> None:
+        """Wraps lst; factor is truncated to int like zoom_array"""
+        self._lst = lst
+        self._factor = max(int(factor), 0)
 
-zoom_3x = zoom_array(array, 3)
+    def __len__(self) -> int:
+        """len(lst) * factor"""
+        return len(self._lst) * self._factor
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Item or list of items of the zoomed sequence"""
+        if isinstance(index, slice):
+            return [self._lst[i // self._factor]
+                    for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ZoomView index out of range")
+        return self._lst[index // self._factor]
+
+    def __iter__(self) -> Iterator:
+        """Iterates without materialising the zoomed sequence"""
+        return chain.from_iterable(
+            map(repeat, self._lst, repeat(self._factor)))
+
+    def __repr__(self) -> str:
+        """Shows the wrapped sequence and factor"""
+        return "ZoomView({!r}, {})".format(self._lst, self._factor)
+
+
+def zoom_view(lst: Sequence, factor: int = 2) -> ZoomView:
+    """Lazy counterpart of zoom_array"""
+    return ZoomView(lst, factor)
+
+
+def zoom_buffer(arr: Any, factor: int = 2) -> Any:
+    """Materialises zoom_array for numeric arrays without Python-level
+    per-item work: numpy.repeat for ndarrays, and for array.array one
+    strided slice assignment per repetition"""
+    factor = max(int(factor), 0)
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(arr, numpy.ndarray):
+        return numpy.repeat(arr, factor)
+    out = buffer_array(arr.typecode, bytes(arr.itemsize * len(arr) * factor))
+    for i in range(factor):
+        out[i::factor] = arr
+    return out
+
+
+if __name__ == '__main__':
+    array = (12, 72, 91)
+
+    zoom_2x = zoom_array(array)
+
+    zoom_3x = zoom_array(array, 3)
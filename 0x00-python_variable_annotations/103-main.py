@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+from array import array
+
+fast_sum = __import__('103-sum_engine').fast_sum
+
+values = [1e16, 1.0, -1e16] * 3
+print(fast_sum(values))
+print(fast_sum(array('d', values)))
+print(fast_sum([0.1] * 1000, parallel_threshold=100) == fast_sum([0.1] * 1000))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of bulk lookups against per-call loops"""
+from typing import Any, Dict, Iterator
+from collections.abc import Mapping
+import random
+import timeit
+safely_get_value = __import__('101-safely_get_value').safely_get_value
+safely_get_many = __import__('101-safely_get_value').safely_get_many
+safe_first_element = __import__('100-safe_first_element').safe_first_element
+first_elements = __import__('100-safe_first_element').first_elements
+
+
+class LazyMapping(Mapping):
+    """Mapping that counts every probe, standing in for one whose
+    lookups are expensive (remote, lazily loaded, ...)"""
+
+    def __init__(self, data: Dict, cost: int = 50) -> None:
+        """Wraps data; each probe burns `cost` loop iterations"""
+        self._data = data
+        self._cost = range(cost)
+        self.probes = 0
+
+    def __getitem__(self, key: Any) -> Any:
+        """Counted, deliberately slow lookup"""
+        self.probes += 1
+        for _ in self._cost:
+            pass
+        return self._data[key]
+
+    def __iter__(self) -> Iterator:
+        """Iterates over the keys"""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Number of keys"""
+        return len(self._data)
+
+
+def benchmark(size: int = 100000, number: int = 10) -> None:
+    """Prints per-call vs bulk timings and LazyMapping probe counts"""
+    data = {i: i * 2 for i in range(size)}
+    keys = [random.randrange(2 * size) for _ in range(size)]
+    seqs = [[i] if i % 3 else [] for i in range(size)]
+    lazy = LazyMapping(data)
+
+    cases = [
+        ("safely_get_value loop (dict)",
+         lambda: [safely_get_value(data, k) for k in keys]),
+        ("safely_get_many (dict)", lambda: safely_get_many(data, keys)),
+        ("safely_get_value loop (lazy)",
+         lambda: [safely_get_value(lazy, k) for k in keys]),
+        ("safely_get_many (lazy)", lambda: safely_get_many(lazy, keys)),
+        ("safe_first_element loop",
+         lambda: [safe_first_element(s) for s in seqs]),
+        ("first_elements", lambda: first_elements(seqs)),
+    ]
+    for name, fn in cases:
+        lazy.probes = 0
+        elapsed = min(timeit.repeat(fn, number=number, repeat=3)) / number
+        probes = " ({} probes)".format(lazy.probes // (3 * number)) \
+            if "lazy" in name else ""
+        print("{:32} {:.6f}s{}".format(name, elapsed, probes))
+
+
+if __name__ == '__main__':
+    benchmark()
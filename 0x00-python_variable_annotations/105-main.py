@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+import io
+
+type_checked = __import__('105-type_checked').type_checked
+add = type_checked(__import__('0-add').add)
+sum_list = type_checked(__import__('5-sum_list').sum_list)
+to_kv = type_checked(__import__('7-to_kv').to_kv)
+concat_many = type_checked(__import__('1-concat').concat_many)
+to_str_many = type_checked(__import__('3-to_str').to_str_many)
+safely_get_value = type_checked(
+    __import__('101-safely_get_value').safely_get_value)
+
+print(add(1.11, 2.22))
+print(sum_list([1.5, 2]))
+print(to_kv("eggs", 3))
+print(safely_get_value({"a": 1}, "a"))
+try:
+    add("1", 2.0)
+except TypeError as e:
+    print(e)
+try:
+    sum_list([1.0, "2"])
+except TypeError as e:
+    print(e)
+sampled = type_checked(__import__('0-add').add, sample=2)
+print([sampled(1.0, 1.0) for _ in range(2)])
+print(type_checked(add, enabled=False) is add)
+print(concat_many(['a'], ['b'], io.StringIO()).getvalue())
+print(to_str_many([1.5], io.BytesIO()).getvalue())
+try:
+    concat_many(['a'], ['b'], "out.txt")
+except TypeError as e:
+    print(e)
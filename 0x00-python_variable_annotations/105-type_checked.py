@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Runtime type checking compiled from the function annotations"""
+from functools import wraps
+from itertools import count
+from typing import (IO, Any, BinaryIO, Callable, List, Optional, TextIO,
+                    TypeVar, Union, get_args, get_origin, get_type_hints)
+import collections.abc
+import inspect
+import os
+
+Checker = Callable[[Any], bool]
+
+# TYPE_CHECKS=0 turns @type_checked into a no-op returning the function
+ENABLED: bool = os.environ.get("TYPE_CHECKS", "1") != "0"
+
+# typing's stream classes are not bases of io's, so they are duck-typed
+STREAMS = (IO, TextIO, BinaryIO)
+
+
+def _all_items(container: type, item: Optional[Checker]) -> Checker:
+    """container instance whose items all pass item"""
+    if item is None:
+        return lambda v: isinstance(v, container)
+    return lambda v: isinstance(v, container) and all(map(item, v))
+
+
+def compile_hint(hint: Any) -> Optional[Checker]:
+    """Turns a type hint into a predicate, or None when anything goes.
+    Iterables are only checked at the top level so that generators are
+    not consumed; float accepts int as in PEP 484 and IO hints accept
+    anything with a write method."""
+    if hint is Any or hint is object:
+        return None
+    if hint is None or hint is type(None):
+        return lambda v: v is None
+    if isinstance(hint, TypeVar):
+        if hint.__bound__ is not None:
+            return compile_hint(hint.__bound__)
+        if hint.__constraints__:
+            return compile_hint(Union[hint.__constraints__])
+        return None
+    if hint is float:
+        return lambda v: isinstance(v, (int, float))
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if hint in STREAMS or origin in STREAMS:
+        return lambda v: hasattr(v, "write")
+    if origin is None:
+        return lambda v: isinstance(v, hint)
+    if origin is Union:
+        checks = [compile_hint(arg) for arg in args]
+        if None in checks:
+            return None
+        return lambda v: any(check(v) for check in checks)
+    if origin is collections.abc.Callable:
+        return callable
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return _all_items(tuple, compile_hint(args[0]))
+        if not args or args == ((),):
+            return lambda v: isinstance(v, tuple)
+        checks = [compile_hint(arg) or (lambda v: True) for arg in args]
+        return lambda v: (isinstance(v, tuple) and len(v) == len(checks)
+                          and all(c(x) for c, x in zip(checks, v)))
+    if origin in (list, set, frozenset, collections.abc.Sequence,
+                  collections.abc.Set):
+        return _all_items(origin, compile_hint(args[0]) if args else None)
+    if origin in (dict, collections.abc.Mapping):
+        if not args:
+            return lambda v: isinstance(v, origin)
+        key = compile_hint(args[0]) or (lambda k: True)
+        value = compile_hint(args[1]) or (lambda k: True)
+        return lambda v: isinstance(v, origin) and all(
+            key(k) and value(x) for k, x in v.items())
+    return lambda v: isinstance(v, origin)
+
+
+def type_checked(fn: Optional[Callable] = None, *, sample: int = 1,
+                 enabled: Optional[bool] = None) -> Callable:
+    """Decorator validating arguments and return value against the
+    annotations of fn. The hints are read and compiled once, at
+    decoration time; with sample=N only every Nth call is checked.
+    When disabled (enabled=False or TYPE_CHECKS=0) fn is returned
+    unchanged, so the switch has no runtime cost."""
+    if fn is None:
+        return lambda f: type_checked(f, sample=sample, enabled=enabled)
+    if not (ENABLED if enabled is None else enabled):
+        return fn
+
+    hints = get_type_hints(fn)
+    params = list(inspect.signature(fn).parameters.values())
+    positional: List[Any] = []
+    for param in params:
+        if param.kind not in (param.POSITIONAL_ONLY,
+                              param.POSITIONAL_OR_KEYWORD):
+            break
+        hint = hints.get(param.name)
+        positional.append((param.name, hint, compile_hint(hint)
+                           if param.name in hints else None))
+    keyword = {name: (hint, check) for name, hint, check in positional}
+    for param in params[len(positional):]:
+        if param.name in hints and param.kind == param.KEYWORD_ONLY:
+            keyword[param.name] = (hints[param.name],
+                                   compile_hint(hints[param.name]))
+    returns = compile_hint(hints["return"]) if "return" in hints else None
+    calls = count()
+
+    def fail(name: str, hint: Any, value: Any) -> None:
+        expected = hint.__name__ if isinstance(hint, type) else hint
+        raise TypeError("{}() {} must be {}, got {}".format(
+            fn.__name__, name, expected, type(value).__name__))
+
+    @wraps(fn)
+    def checked(*args: Any, **kwargs: Any) -> Any:
+        """Checks a sample of calls before and after calling fn"""
+        if sample > 1 and next(calls) % sample:
+            return fn(*args, **kwargs)
+        for (name, hint, check), value in zip(positional, args):
+            if check is not None and not check(value):
+                fail("argument '{}'".format(name), hint, value)
+        for name, value in kwargs.items():
+            hint, check = keyword.get(name, (None, None))
+            if check is not None and not check(value):
+                fail("argument '{}'".format(name), hint, value)
+        result = fn(*args, **kwargs)
+        if returns is not None and not returns(result):
+            fail("return value", hints["return"], result)
+        return result
+
+    return checked
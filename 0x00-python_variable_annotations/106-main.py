@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+
+parallel_map = __import__('106-parallel_map').parallel_map
+to_str = __import__('3-to_str').to_str
+add = __import__('0-add').add
+
+print(list(parallel_map(to_str, [1.5, 2.25, 3.0], chunk_size=2)))
+print(list(parallel_map(add, zip(range(5), range(5)), chunk_size=2,
+                        star=True)))
+print(sorted(parallel_map(to_str, range(10), chunk_size=3, ordered=False)))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Chunked process-pool map for the pure scalar functions"""
+from collections import deque
+from functools import partial
+from itertools import islice, starmap
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+import os
+import sys
+import timeit
+
+
+def _apply(fn: Callable, star: bool, chunk: List[Any]) -> List[Any]:
+    """Maps fn over one chunk inside a worker process"""
+    return list(starmap(fn, chunk) if star else map(fn, chunk))
+
+
+def map_chunks(fn: Callable[[List[Any]], Any], iterable: Iterable[Any],
+               chunk_size: int = 1024, workers: Optional[int] = None,
+               ordered: bool = True,
+               max_pending: Optional[int] = None) -> Iterator[Any]:
+    """Yields fn(chunk) for consecutive chunks of chunk_size items,
+    computed in a process pool. Input is read lazily and at most
+    max_pending chunks (default two per worker) are in flight, so memory
+    stays bounded. With ordered=False results are yielded as soon as
+    any chunk finishes. fn must be picklable (a module-level function)."""
+    from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                    wait)
+
+    workers = workers or os.cpu_count() or 1
+    limit = max_pending or 2 * workers
+    it = iter(iterable)
+    pool = ProcessPoolExecutor(workers)
+    pending: deque = deque()
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < limit:
+                chunk = list(islice(it, chunk_size))
+                if not chunk:
+                    exhausted = True
+                    break
+                pending.append(pool.submit(fn, chunk))
+            if not pending:
+                return
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def parallel_map(fn: Callable, iterable: Iterable[Any],
+                 chunk_size: int = 1024, workers: Optional[int] = None,
+                 ordered: bool = True, star: bool = False,
+                 max_pending: Optional[int] = None) -> Iterator[Any]:
+    """Streaming map(fn, iterable) over a process pool, one task per
+    chunk. star=True unpacks each item as arguments (like starmap), e.g.
+    parallel_map(add, zip(xs, ys), star=True)."""
+    chunks = map_chunks(partial(_apply, fn, star), iterable, chunk_size,
+                        workers, ordered, max_pending)
+    try:
+        for chunk in chunks:
+            yield from chunk
+    finally:
+        chunks.close()
+
+
+def benchmark(size: int = 10 ** 6,
+              chunk_sizes: Iterable[int] = (100, 1000, 10000, 100000)
+              ) -> None:
+    """Prints serial vs parallel_map timings of to_str and add"""
+    to_str = __import__('3-to_str').to_str
+    add = __import__('0-add').add
+    floats = [i * 0.5 for i in range(size)]
+    pairs = list(zip(floats, floats))
+    cases = [("to_str", to_str, floats, False), ("add", add, pairs, True)]
+    for name, fn, data, star in cases:
+        serial = timeit.timeit(
+            lambda: list(starmap(fn, data) if star else map(fn, data)),
+            number=1)
+        print("{:8} serial {:>8}: {:.3f}s".format(name, "", serial))
+        for chunk_size in chunk_sizes:
+            elapsed = timeit.timeit(lambda: sum(1 for _ in parallel_map(
+                fn, data, chunk_size, star=star)), number=1)
+            print("{:8} chunk {:>9}: {:.3f}s".format(
+                name, chunk_size, elapsed))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
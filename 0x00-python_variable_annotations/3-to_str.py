@@ -1,7 +1,29 @@
 #!/usr/bin/env python3
 """Type-annotated function floor"""
+from array import array
+from itertools import chain, repeat
+from typing import IO, Iterable, List, Optional, Union
+text_sink = __import__('1-concat').text_sink
 
 
 def to_str(n: float) -> str:
     """Takes a float and returns its str repr"""
     return str(n)
+
+
+def to_str_many(floats: Iterable[float], out: Optional[IO] = None,
+                sep: str = "\n", encoding: str = "utf-8"
+                ) -> Union[List[str], IO]:
+    """to_str over a batch of floats (list, array('d'), ...).
+    Float arrays are formatted with float.__repr__, the same text as
+    str() without its type dispatch. With out, each value and sep are
+    streamed to the text or binary stream and out is returned."""
+    if isinstance(floats, array) and floats.typecode in "fd":
+        strings = map(float.__repr__, floats)
+    else:
+        strings = map(str, floats)
+    if out is None:
+        return list(strings)
+    with text_sink(out, encoding) as stream:
+        stream.writelines(chain.from_iterable(zip(strings, repeat(sep))))
+    return out
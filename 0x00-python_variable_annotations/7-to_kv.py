@@ -1,9 +1,54 @@
 #!/usr/bin/env python3
 """Type-annotated function to_kv"""
-from typing import Union, Tuple
+from array import array
+from operator import mul
+from typing import Any, Iterable, List, Union, Tuple
+import sys
+
+
+def float64_out(out: Any, size: int) -> memoryview:
+    """Writable float64 view of `out`, checked to hold `size` items"""
+    view = memoryview(out)
+    if view.readonly or view.format not in ('d', '<d', '=d'):
+        raise TypeError("out must be a writable float64 buffer, got "
+                        "format {!r}".format(view.format))
+    if len(view) != size:
+        raise ValueError("out has {} items, expected {}".format(
+            len(view), size))
+    return view
+
+
+def square_many(values: Any, out: Any = None) -> Any:
+    """Squares a batch of numbers in one call: numpy.square for ndarrays,
+    an array('d') for anything else, or written item by item into the
+    float64 buffer `out` without a temporary array"""
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return numpy.square(values, out=out)
+    if isinstance(values, (array, memoryview)):
+        values = memoryview(values)
+    else:
+        values = list(values)
+    if out is None:
+        return array('d', map(mul, values, values))
+    view = float64_out(out, len(values))
+    for i, square in enumerate(map(mul, values, values)):
+        view[i] = square
+    return out
 
 
 def to_kv(k: str, v: Union[int, float]) -> Tuple[str, float]:
     """Returns tuple of a string and a float"""
+    numpy = sys.modules.get("numpy")
+    if isinstance(v, (array, memoryview)) or (
+            numpy is not None and isinstance(v, numpy.ndarray)):
+        return (k, square_many(v))
     x = v ** 2
     return (k, x)
+
+
+def to_kv_many(keys: Iterable[str], values: Any,
+               out: Any = None) -> Tuple[List[str], Any]:
+    """Columnar to_kv: returns the keys and the squared values as one
+    array (ndarray for ndarray input), written into `out` if given"""
+    return list(keys), square_many(values, out)
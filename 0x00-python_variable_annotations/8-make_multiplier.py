@@ -1,8 +1,32 @@
 #!/usr/bin/env python3
 """Type-annotated function make_multiplier"""
-from typing import Callable
+from array import array
+from itertools import repeat
+from operator import mul
+from typing import Any, Callable
+import sys
+float64_out = __import__('7-to_kv').float64_out
 
 
 def make_multiplier(multiplier: float) -> Callable[[float], float]:
-    """Returns a function that multiplies the float"""
-    return lambda x: x * multiplier
+    """Returns a function that multiplies the float.
+    The function also takes an array.array, memoryview or ndarray and
+    multiplies the whole batch in one call, writing into `out` if given
+    (an ndarray for ndarray input, otherwise a float64 buffer).
+    """
+    def multiply(x: Any, out: Any = None) -> Any:
+        """Multiplies a float or a batch of numbers by multiplier"""
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(x, numpy.ndarray):
+            return numpy.multiply(x, multiplier, out=out)
+        if not isinstance(x, (array, memoryview)):
+            return x * multiplier
+        x = memoryview(x)
+        products = map(mul, x, repeat(multiplier))
+        if out is None:
+            return array('d', products)
+        view = float64_out(out, len(x))
+        for i, product in enumerate(products):
+            view[i] = product
+        return out
+    return multiply
@@ -1,8 +1,38 @@
 #!/usr/bin/env python3
 """Type-annotated function element_length"""
-from typing import Iterable, List, Sequence, Tuple
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+map_chunks = __import__('106-parallel_map').map_chunks
 
 
 def element_length(lst: Iterable[Sequence]) -> List[Tuple[Sequence, int]]:
     """Returns a list of tuples of sequence and int"""
     return [(i, len(i)) for i in lst]
+
+
+def iter_element_length(lst: Iterable[Sequence]
+                        ) -> Iterator[Tuple[Sequence, int]]:
+    """Lazily yields the (sequence, length) pairs of element_length"""
+    for i in lst:
+        yield i, len(i)
+
+
+def element_length_columnar(lst: Iterable[Sequence]
+                            ) -> Tuple[List[Sequence], array]:
+    """Returns the sequences and an array('q') of their lengths"""
+    seqs = list(lst)
+    return seqs, array('q', map(len, seqs))
+
+
+def _chunk_lengths(chunk: List[Sequence]) -> array:
+    """Lengths of one chunk, computed in a worker process"""
+    return array('q', map(len, chunk))
+
+
+def element_length_chunked(lst: Iterable[Sequence], chunk_size: int = 10000,
+                           workers: Optional[int] = None) -> Iterator[array]:
+    """Yields, in input order, an array('q') of lengths per chunk of
+    chunk_size sequences, computed across a process pool. At most two
+    chunks per worker are in flight, so memory stays bounded for
+    unbounded inputs."""
+    return map_chunks(_chunk_lengths, lst, chunk_size, workers)
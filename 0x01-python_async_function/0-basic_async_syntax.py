@@ -3,10 +3,14 @@
 
 import asyncio
 import random
+from typing import Any
 
 
-async def wait_random(max_delay: int = 10) -> float:
-    """ Waits for random delay between 0 and max_delay"""
+async def wait_random(max_delay: int = 10, monitor: Any = None) -> float:
+    """ Waits for random delay between 0 and max_delay
+
+    monitor, if given, is a LoopMonitor whose sleep() records wakeup lag
+    """
     delay = random.uniform(0, max_delay)
-    await asyncio.sleep(delay)
+    await (monitor.sleep if monitor is not None else asyncio.sleep)(delay)
     return delay
@@ -2,16 +2,19 @@
 """ Takes 2 int args, waits for random delay """
 
 import asyncio
-from typing import List
+from typing import Any, List
 wait_random = __import__('0-basic_async_syntax').wait_random
 
 
-async def wait_n(n: int, max_delay: int) -> List[float]:
+async def wait_n(n: int, max_delay: int, monitor: Any = None) -> List[float]:
     """
     runs multiple wait_random coroutines concurrently
     and returns the results in ascending order without using sort().
+    monitor, if given, is a LoopMonitor that tracks the spawned tasks.
     """
-    tasks = [asyncio.create_task(wait_random(max_delay)) for _ in range(n)]
+    create_task = (monitor.create_task if monitor is not None
+                   else asyncio.create_task)
+    tasks = [create_task(wait_random(max_delay, monitor)) for _ in range(n)]
     delays = []
     for task in asyncio.as_completed(tasks):
         delay = await task
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+""" Event-loop lag and task instrumentation """
+
+from collections import deque
+from typing import Any, Awaitable, Deque, Dict, Optional, Tuple
+import asyncio
+import math
+import time
+
+
+class Histogram:
+    """ power-of-two bucketed histogram of durations in seconds """
+
+    def __init__(self, resolution: float = 1e-6, buckets: int = 32) -> None:
+        """ bucket i holds values below resolution * 2 ** i """
+        self.resolution = resolution
+        self.counts = [0] * buckets
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """ adds one observation """
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        index = math.frexp(value / self.resolution)[1] if value > 0 else 0
+        if index < 0:
+            index = 0
+        elif index >= len(self.counts):
+            index = len(self.counts) - 1
+        self.counts[index] += 1
+
+    def percentile(self, q: float) -> float:
+        """ upper bound of the bucket holding the q-th percentile """
+        if not self.count:
+            return 0.0
+        target = self.count * q / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.resolution * 2 ** index, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """ JSON-serialisable view of the histogram """
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "buckets": {
+                repr(self.resolution * 2 ** i): n
+                for i, n in enumerate(self.counts) if n
+            },
+        }
+
+
+class LoopMonitor:
+    """
+    Opt-in instrumentation for coroutines running on one event loop.
+
+    Pass an instance as `monitor` to wait_random/wait_n (or the 0x02
+    generators) to record how late each asyncio.sleep wakes up, how
+    many tasks are alive and how long they ran. start() adds a
+    heartbeat that flags callbacks blocking the loop for longer than
+    `slow_callback` seconds.
+    """
+
+    def __init__(self, slow_callback: float = 0.1,
+                 heartbeat: float = 0.05, keep_slow: int = 100) -> None:
+        """ all durations are in seconds """
+        self.slow_callback = slow_callback
+        self.heartbeat = heartbeat
+        self.sleep_lag = Histogram()
+        self.loop_lag = Histogram()
+        self.task_duration = Histogram()
+        self.live_tasks = 0
+        self.peak_tasks = 0
+        self.slow_callbacks = 0
+        self.recent_slow: Deque[Tuple[float, float]] = deque(
+            maxlen=keep_slow)
+        self._watcher: Optional[asyncio.Task] = None
+
+    async def sleep(self, delay: float, result: Any = None) -> Any:
+        """ asyncio.sleep that records its wakeup lag """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        value = await asyncio.sleep(delay, result)
+        lag = loop.time() - start - delay
+        self.sleep_lag.record(lag if lag > 0 else 0.0)
+        return value
+
+    def create_task(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """ asyncio.create_task that counts the task and its duration """
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(coro)
+        start = loop.time()
+        self.live_tasks += 1
+        if self.live_tasks > self.peak_tasks:
+            self.peak_tasks = self.live_tasks
+
+        def done(_: asyncio.Future) -> None:
+            self.live_tasks -= 1
+            self.task_duration.record(loop.time() - start)
+
+        task.add_done_callback(done)
+        return task
+
+    async def _watch(self) -> None:
+        """ heartbeat measuring scheduled-vs-actual wakeup of the loop """
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.heartbeat)
+            lag = loop.time() - start - self.heartbeat
+            if lag < 0:
+                lag = 0.0
+            self.loop_lag.record(lag)
+            if lag >= self.slow_callback:
+                self.slow_callbacks += 1
+                self.recent_slow.append((time.time(), lag))
+
+    def start(self) -> None:
+        """ starts the heartbeat on the running loop """
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.get_running_loop().create_task(
+                self._watch())
+
+    def stop(self) -> None:
+        """ stops the heartbeat """
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """ JSON-serialisable view of everything recorded so far """
+        try:
+            loop_tasks = len(asyncio.all_tasks())
+        except RuntimeError:
+            loop_tasks = 0
+        return {
+            "sleep_lag": self.sleep_lag.snapshot(),
+            "loop_lag": self.loop_lag.snapshot(),
+            "task_duration": self.task_duration.snapshot(),
+            "live_tasks": self.live_tasks,
+            "peak_tasks": self.peak_tasks,
+            "loop_tasks": loop_tasks,
+            "slow_callbacks": self.slow_callbacks,
+            "recent_slow": list(self.recent_slow),
+        }
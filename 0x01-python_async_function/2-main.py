@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+LoopMonitor = __import__('2-loop_monitor').LoopMonitor
+wait_n = __import__('1-concurrent_coroutines').wait_n
+
+
+async def main():
+    monitor = LoopMonitor()
+    monitor.start()
+    delays = await wait_n(10, 1, monitor)
+    monitor.stop()
+    return delays, monitor.snapshot()
+
+delays, snapshot = asyncio.run(main())
+print(len(delays))
+print(snapshot["sleep_lag"]["count"], snapshot["task_duration"]["count"])
+print(snapshot["live_tasks"], snapshot["peak_tasks"])
@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+wait_n_sharded = __import__('3-sharded_wait_n').wait_n_sharded
+
+delays = asyncio.run(wait_n_sharded(100, 1, workers=4))
+print(len(delays))
+print(all(a <= b for a, b in zip(delays, delays[1:])))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+""" Splits wait_n over a pool of worker processes """
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+import asyncio
+import heapq
+import os
+import sys
+import timeit
+wait_n = __import__('1-concurrent_coroutines').wait_n
+
+
+def shard_sizes(n: int, workers: int) -> List[int]:
+    """ splits n into `workers` near-equal non-empty parts """
+    workers = max(1, min(workers, n))
+    base, extra = divmod(n, workers)
+    return [base + (i < extra) for i in range(workers)] if n else []
+
+
+def _burn(spin: int) -> None:
+    """ stands in for CPU-bound post-processing of one result """
+    for _ in range(spin):
+        pass
+
+
+def _run_shard(n: int, max_delay: int, spin: int = 0) -> List[float]:
+    """ runs wait_n on this process' own event loop """
+    delays = asyncio.run(wait_n(n, max_delay))
+    for _ in delays:
+        _burn(spin)
+    return delays
+
+
+async def wait_n_sharded(n: int, max_delay: int,
+                         workers: Optional[int] = None,
+                         executor: Optional[Executor] = None,
+                         spin: int = 0) -> List[float]:
+    """
+    runs n wait_random coroutines split over `workers` processes (default
+    os.cpu_count()), each with its own event loop, and k-way merges the
+    ascending per-worker results so the output matches wait_n's order.
+    Pass `executor` to reuse a pool across calls, with `workers` set to
+    its size since executors do not expose it.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+    pool = executor or ProcessPoolExecutor(workers)
+    try:
+        shards = await asyncio.gather(*(
+            loop.run_in_executor(pool, _run_shard, size, max_delay, spin)
+            for size in shard_sizes(n, workers)))
+    finally:
+        if executor is None:
+            pool.shutdown()
+    return list(heapq.merge(*shards))
+
+
+def scaling_benchmark(n: int, max_delay: int, max_workers: int = None,
+                      spin: int = 0) -> List[Tuple[int, float]]:
+    """ wall-clock time of wait_n_sharded for 1..max_workers processes """
+    results = []
+    for workers in range(1, (max_workers or os.cpu_count() or 1) + 1):
+        with ProcessPoolExecutor(workers) as pool:
+            # spawn the workers before timing
+            list(pool.map(_burn, [0] * workers))
+            start = timeit.default_timer()
+            asyncio.run(wait_n_sharded(n, max_delay, workers, pool, spin))
+            results.append((workers, timeit.default_timer() - start))
+    return results
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    n, max_delay, spin = (args + [10000, 0, 20000][len(args):])[:3]
+    for workers, elapsed in scaling_benchmark(n, max_delay, spin=spin):
+        print("{:3d} workers: {:.3f}s".format(workers, elapsed))
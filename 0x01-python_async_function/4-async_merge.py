@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+""" Streaming k-way merge of ascending async iterables """
+
+from typing import (Any, AsyncIterable, AsyncIterator, Callable, Dict,
+                    List, Optional, TypeVar)
+import asyncio
+import heapq
+from itertools import count
+wait_random = __import__('0-basic_async_syntax').wait_random
+shard_sizes = __import__('3-sharded_wait_n').shard_sizes
+
+T = TypeVar('T')
+
+
+async def merge_async(*sources: AsyncIterable[T],
+                      key: Optional[Callable[[T], Any]] = None,
+                      strict: bool = True) -> AsyncIterator[T]:
+    """
+    merges individually ascending async iterables into one ascending
+    stream. All sources are awaited concurrently, but each one is only
+    asked for its next item once its current head has been emitted, so
+    at most one item per source is buffered. The last key seen from
+    each source is its watermark: the smallest head is yielded as soon
+    as it is no greater than the watermark of every source still
+    fetching its next item.
+    A source going backwards raises ValueError, or with strict=False the
+    late item is emitted as soon as possible without moving the watermark.
+    An exception raised by a source cancels the others and is re-raised.
+    """
+    key = key or (lambda item: item)
+    iterators = [source.__aiter__() for source in sources]
+    # task fetching the next item -> index of its source
+    pending: Dict[asyncio.Future, int] = {
+        asyncio.ensure_future(it.__anext__()): i
+        for i, it in enumerate(iterators)}
+    # None: nothing seen yet
+    watermarks: List[Any] = [None] * len(sources)
+    heap: List[Any] = []
+    counter = count()
+
+    def push(index: int, item: Any) -> None:
+        """ buffers the new head of source index """
+        item_key = key(item)
+        mark = watermarks[index]
+        if mark is None or item_key >= mark:
+            watermarks[index] = item_key
+        elif strict:
+            raise ValueError("source {} is not ascending".format(index))
+        heapq.heappush(heap, (item_key, next(counter), index, item))
+
+    try:
+        while pending or heap:
+            if heap and all(watermarks[i] is not None
+                            and heap[0][0] <= watermarks[i]
+                            for i in pending.values()):
+                _, _, index, item = heapq.heappop(heap)
+                yield item
+                following = iterators[index].__anext__()
+                if pending:
+                    pending[asyncio.ensure_future(following)] = index
+                    continue
+                # every other source has a head: no need for a task
+                try:
+                    push(index, await following)
+                except StopAsyncIteration:
+                    pass
+                continue
+            done, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                try:
+                    push(index, task.result())
+                except StopAsyncIteration:
+                    pass
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _completed(n: int, max_delay: int) -> AsyncIterator[float]:
+    """ yields n wait_random results in completion order """
+    tasks = [asyncio.create_task(wait_random(max_delay)) for _ in range(n)]
+    for task in asyncio.as_completed(tasks):
+        yield await task
+
+
+async def wait_n_stream(n: int, max_delay: int,
+                        streams: int = 4) -> AsyncIterator[float]:
+    """
+    wait_n as an async iterator: the n coroutines are split into
+    `streams` groups and their results are merged so each delay is
+    yielded, in ascending order, as soon as it is known to be minimal.
+    Like wait_n, ordering relies on completion order following delays.
+    """
+    async for delay in merge_async(
+            *(_completed(size, max_delay)
+              for size in shard_sizes(n, streams)), strict=False):
+        yield delay
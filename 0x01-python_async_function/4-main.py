@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+async_merge = __import__('4-async_merge')
+
+
+async def ascending(start, step, count):
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield start + i * step
+
+
+async def counted(count, produced):
+    for i in range(count):
+        produced.append(i)
+        yield i
+
+
+async def late(delay):
+    await asyncio.sleep(delay)
+    yield -1
+
+
+async def main():
+    merged = [x async for x in async_merge.merge_async(
+        ascending(0, 3, 4), ascending(1, 2, 5), ascending(5, 1, 2))]
+    print(merged)
+    delays = [d async for d in async_merge.wait_n_stream(10, 1)]
+    print(len(delays), delays == sorted(delays))
+    produced = []
+    merged = async_merge.merge_async(counted(100000, produced), late(0.5))
+    first = await merged.__anext__()
+    print(first, len(produced) <= 2)
+    await merged.aclose()
+
+asyncio.run(main())
@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 """ Coroutine with async """
 
-from typing import Generator
+from typing import Any, Generator
 import asyncio
 import random
 
 
-async def async_generator() -> Generator[float, None, None]:
+async def async_generator(monitor: Any = None) -> Generator[float, None, None]:
     """
     loop 10 times, each time asynchronously wait 1 second,
-    then yield a random number between 0 and 10
+    then yield a random number between 0 and 10.
+    monitor, if given, is a LoopMonitor whose sleep() records wakeup lag
     """
+    sleep = monitor.sleep if monitor is not None else asyncio.sleep
     for _ in range(10):
         yield random.random()
-        await asyncio.sleep(1)
+        await sleep(1)
@@ -7,15 +7,10 @@ import timeit
 async_comprehension = __import__('1-async_comprehension').async_comprehension
 
 
-async def measure_runtime() -> float:
-    """ executes comprehension func 4 times in parallel, returns runtime """
+async def measure_runtime(n: int = 4) -> float:
+    """ executes comprehension func n times in parallel, returns runtime """
 
     start = timeit.default_timer()
-    await asyncio.gather(
-        async_comprehension(),
-        async_comprehension(),
-        async_comprehension(),
-        async_comprehension()
-        )
+    await asyncio.gather(*(async_comprehension() for _ in range(n)))
     stop = timeit.default_timer()
     return stop - start
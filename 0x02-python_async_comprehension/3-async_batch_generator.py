@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+""" Coroutine yielding blocks of random numbers """
+
+from array import array
+from itertools import repeat, starmap
+from typing import Any, AsyncGenerator, Optional
+import asyncio
+import random
+
+
+def _numpy() -> Any:
+    """ numpy, imported on the first use_numpy=True call only """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("use_numpy=True requires numpy") from None
+    return numpy
+
+
+def random_block(size: int, use_numpy: bool = False) -> Any:
+    """
+    returns `size` random numbers between 0 and 1 generated in one call,
+    as an array('d') or, with use_numpy, a float64 ndarray
+    """
+    if use_numpy:
+        return _numpy().random.random(size)
+    return array('d', starmap(random.random, repeat((), size)))
+
+
+async def async_batch_generator(
+        batch_size: int = 1024,
+        batches: int = 10,
+        out: Optional[Any] = None,
+        use_numpy: bool = False,
+        delay: float = 1
+        ) -> AsyncGenerator[memoryview, None]:
+    """
+    loop `batches` times, each time yield a block of `batch_size`
+    random numbers between 0 and 1, then asynchronously wait `delay`.
+
+    When `out` (a writable float64 buffer of batch_size * batches items)
+    is given, each block is written into its slice of `out` and the
+    yielded views share its memory, so no concatenation is needed.
+    """
+    view = memoryview(out).cast('B').cast('d') if out is not None else None
+    if use_numpy and view is not None:
+        numpy = _numpy()
+        rng = numpy.random.default_rng()
+    for i in range(batches):
+        if view is None:
+            block = memoryview(random_block(batch_size, use_numpy))
+        else:
+            block = view[i * batch_size:(i + 1) * batch_size]
+            if use_numpy:
+                rng.random(out=numpy.frombuffer(block, dtype='d'))
+            else:
+                block[:] = random_block(batch_size)
+        yield block
+        await asyncio.sleep(delay)
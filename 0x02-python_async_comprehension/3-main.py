@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+async_batch_generator = __import__(
+    '3-async_batch_generator').async_batch_generator
+
+
+async def print_yielded_blocks():
+    async for block in async_batch_generator(4, 3, delay=0):
+        print(block.tolist())
+
+asyncio.run(print_yielded_blocks())
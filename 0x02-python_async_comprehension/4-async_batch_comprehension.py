@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+""" Comprehension over random number blocks """
+
+from array import array
+from typing import Any
+async_batch_generator = __import__(
+    '3-async_batch_generator').async_batch_generator
+numpy = __import__('3-async_batch_generator').numpy
+
+
+async def async_batch_comprehension(
+        batch_size: int = 1024,
+        batches: int = 10,
+        use_numpy: bool = False,
+        delay: float = 1
+        ) -> Any:
+    """
+    Collects batches * batch_size rand nums into one contiguous
+    array('d') (or ndarray with use_numpy); blocks are generated in place
+    so they are never copied into a List[float]
+    """
+    size = batch_size * batches
+    if use_numpy:
+        if numpy is None:
+            raise ImportError("use_numpy=True requires numpy")
+        out = numpy.empty(size, dtype='d')
+    else:
+        out = array('d', bytes(8 * size))
+    async for _ in async_batch_generator(
+            batch_size, batches, out=out, use_numpy=use_numpy, delay=delay):
+        pass
+    return out
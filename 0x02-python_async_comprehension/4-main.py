@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+async_batch_comprehension = __import__(
+    '4-async_batch_comprehension').async_batch_comprehension
+
+
+async def main():
+    result = await async_batch_comprehension(1000, 10, delay=0)
+    print(type(result), len(result))
+    print(all(0 <= x < 1 for x in result))
+
+asyncio.run(main())
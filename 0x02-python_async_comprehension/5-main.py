@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+
+runtime_benchmark = __import__('5-runtime_benchmark')
+
+workload = runtime_benchmark.batch_workload(delay=0)
+for record in runtime_benchmark.benchmark(workload, [1, 4], repeat=3):
+    print(record["loop"], record["concurrency"], record["runtime"]["median"])
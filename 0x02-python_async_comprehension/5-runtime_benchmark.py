@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+""" Benchmark harness for measure_runtime """
+
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import timeit
+measure_runtime = __import__('2-measure_runtime').measure_runtime
+async_batch_comprehension = __import__(
+    '4-async_batch_comprehension').async_batch_comprehension
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+Workload = Callable[[int], Awaitable[float]]
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """ nearest-rank percentile of samples, q in [0, 100] """
+    ordered = sorted(samples)
+    if not ordered:
+        return float('nan')
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """ min/median/p95/p99/max of a list of timings """
+    if not samples:
+        return {}
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "max": max(samples),
+    }
+
+
+def batch_workload(delay: float = 0.01) -> Workload:
+    """ measure_runtime equivalent over async_batch_comprehension """
+    async def run(n: int) -> float:
+        start = timeit.default_timer()
+        await asyncio.gather(
+            *(async_batch_comprehension(delay=delay) for _ in range(n)))
+        return timeit.default_timer() - start
+    return run
+
+
+async def _lag_monitor(interval: float, lags: List[float]) -> None:
+    """ records how late the loop wakes up a sleep of `interval` """
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - start - interval)
+
+
+async def run_level(workload: Workload, concurrency: int, warmup: int,
+                    repeat: int, lag_interval: float) -> Dict[str, Any]:
+    """ runs warmup + repeat iterations of workload at one concurrency """
+    for _ in range(warmup):
+        await workload(concurrency)
+    lags: List[float] = []
+    monitor = asyncio.create_task(_lag_monitor(lag_interval, lags))
+    samples = [await workload(concurrency) for _ in range(repeat)]
+    monitor.cancel()
+    try:
+        await monitor
+    except asyncio.CancelledError:
+        pass
+    return {
+        "concurrency": concurrency,
+        "samples": samples,
+        "runtime": summarize(samples),
+        "loop_lag": summarize(lags),
+    }
+
+
+def _run_in_thread(coro: Awaitable[Any]) -> Any:
+    """ runs coro on a fresh event loop owned by a worker thread """
+    result: Dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as exc:
+            result["error"] = exc
+
+    thread = threading.Thread(target=target, name="benchmark-loop")
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def available_loops() -> List[str]:
+    """ names of the event loop flavours usable in this interpreter """
+    loops = ["default", "thread"]
+    if uvloop is not None:
+        loops.append("uvloop")
+    return loops
+
+
+def run_on_loop(kind: str, coro: Awaitable[Any]) -> Any:
+    """ runs coro to completion on the loop flavour `kind` """
+    if kind == "default":
+        return asyncio.run(coro)
+    if kind == "thread":
+        return _run_in_thread(coro)
+    if kind == "uvloop":
+        if uvloop is None:
+            raise ValueError("uvloop is not installed")
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    raise ValueError("unknown loop kind: {}".format(kind))
+
+
+def benchmark(workload: Workload, levels: Sequence[int],
+              loops: Sequence[str] = ("default",), warmup: int = 1,
+              repeat: int = 5, lag_interval: float = 0.001
+              ) -> List[Dict[str, Any]]:
+    """ sweeps concurrency levels on each loop flavour """
+    results = []
+    for kind in loops:
+        for level in levels:
+            record = run_on_loop(kind, run_level(
+                workload, level, warmup, repeat, lag_interval))
+            record["loop"] = kind
+            results.append(record)
+    return results
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """ command line entry point """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--loops", nargs="+", default=["default"],
+                        choices=["default", "thread", "uvloop", "all"])
+    parser.add_argument("--workload", choices=["comprehension", "batch"],
+                        default="batch")
+    parser.add_argument("--delay", type=float, default=0.01,
+                        help="sleep per block for the batch workload")
+    parser.add_argument("--output", help="write JSON results to this path")
+    args = parser.parse_args(argv)
+
+    loops = available_loops() if "all" in args.loops else args.loops
+    workload = (measure_runtime if args.workload == "comprehension"
+                else batch_workload(args.delay))
+    results = benchmark(workload, args.levels, loops,
+                        args.warmup, args.repeat)
+
+    for record in results:
+        stats = record["runtime"]
+        print("{:8} n={:<5} min={:.4f} median={:.4f} p95={:.4f} "
+              "p99={:.4f} lag_p99={:.6f}".format(
+                  record["loop"], record["concurrency"], stats["min"],
+                  stats["median"], stats["p95"], stats["p99"],
+                  record["loop_lag"].get("p99", float("nan"))))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"workload": args.workload, "results": results},
+                      f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
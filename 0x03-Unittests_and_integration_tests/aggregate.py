@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Incremental, mergeable aggregates over the repos of many orgs.
+"""
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from client import GithubOrgClient
+from utils import access_nested_map
+
+__all__ = [
+    "RepoAggregate",
+    "aggregate_clients",
+    "aggregate_orgs",
+]
+
+
+def _field(repo: Dict, path: Sequence[str]) -> Any:
+    """Value at path in repo, None when missing"""
+    try:
+        return access_nested_map(repo, path)
+    except (KeyError, TypeError):
+        return None
+
+
+class RepoAggregate:
+    """Group-by/count/sum/top-k over a stream of repos in bounded memory.
+
+    Memory grows with the number of distinct group keys and `top_k`,
+    never with the number of repos or orgs. Aggregates with the same
+    configuration can be merged, so partial results computed in other
+    processes (the object pickles) combine into one.
+    Example
+    -------
+    >>> agg = RepoAggregate(group_by="license.key", top_k=3)
+    >>> agg.add_many(client.repos_payload, org="google")
+    >>> agg.result()["groups"]["apache-2.0"]["count"]
+    4
+    """
+
+    def __init__(self, group_by: Optional[str] = "license.key",
+                 sum_fields: Sequence[str] = ("forks_count",
+                                              "watchers_count"),
+                 top_field: str = "stargazers_count",
+                 top_k: int = 10) -> None:
+        """Init method of RepoAggregate"""
+        self.group_by = group_by
+        self.sum_fields = tuple(sum_fields)
+        self.top_field = top_field
+        self.top_k = top_k
+        self._group_path = group_by.split(".") if group_by else None
+        self._sum_paths = [name.split(".") for name in self.sum_fields]
+        self._top_path = top_field.split(".")
+        self.orgs = 0
+        self.repos = 0
+        self.sums: Dict[str, float] = dict.fromkeys(self.sum_fields, 0)
+        self.groups: Dict[Any, Dict[str, float]] = {}
+        self._top: List[Tuple[Any, str, str]] = []
+
+    def _config(self) -> Tuple:
+        """Settings that must match for two aggregates to merge"""
+        return (self.group_by, self.sum_fields, self.top_field, self.top_k)
+
+    def _push_top(self, entry: Tuple[Any, str, str]) -> None:
+        """Keeps entry if it is among the top_k seen so far"""
+        if len(self._top) < self.top_k:
+            heapq.heappush(self._top, entry)
+        elif entry > self._top[0]:
+            heapq.heapreplace(self._top, entry)
+
+    def add(self, repo: Dict, org: str = "") -> None:
+        """Folds one repo into the aggregate"""
+        self.repos += 1
+        values = [_field(repo, path) for path in self._sum_paths]
+        for name, value in zip(self.sum_fields, values):
+            if value:
+                self.sums[name] += value
+        if self._group_path is not None:
+            key = _field(repo, self._group_path)
+            group = self.groups.get(key)
+            if group is None:
+                group = self.groups[key] = dict.fromkeys(
+                    ("count",) + self.sum_fields, 0)
+            group["count"] += 1
+            for name, value in zip(self.sum_fields, values):
+                if value:
+                    group[name] += value
+        if self.top_k:
+            score = _field(repo, self._top_path)
+            if score is not None:
+                self._push_top((score, org, repo.get("name", "")))
+
+    def add_many(self, repos: Iterable[Dict], org: str = "") -> None:
+        """Folds the repos of one org into the aggregate"""
+        self.orgs += 1
+        for repo in repos:
+            self.add(repo, org)
+
+    def merge(self, other: "RepoAggregate") -> "RepoAggregate":
+        """Adds other's partial results to this aggregate"""
+        if other._config() != self._config():
+            raise ValueError("cannot merge aggregates with different "
+                             "settings: {} != {}".format(
+                                 self._config(), other._config()))
+        self.orgs += other.orgs
+        self.repos += other.repos
+        for name, value in other.sums.items():
+            self.sums[name] += value
+        for key, theirs in other.groups.items():
+            ours = self.groups.setdefault(key, dict.fromkeys(theirs, 0))
+            for name, value in theirs.items():
+                ours[name] += value
+        for entry in other._top:
+            self._push_top(entry)
+        return self
+
+    def top(self) -> List[Dict[str, Any]]:
+        """Top repos by top_field, highest first"""
+        return [{"org": org, "name": name, self.top_field: score}
+                for score, org, name in sorted(self._top, reverse=True)]
+
+    def result(self) -> Dict[str, Any]:
+        """Plain-dict report of everything aggregated so far"""
+        return {
+            "orgs": self.orgs,
+            "repos": self.repos,
+            "sums": dict(self.sums),
+            "groups": {key: dict(value)
+                       for key, value in self.groups.items()},
+            "top": self.top(),
+        }
+
+
+def aggregate_clients(clients: Iterable[GithubOrgClient],
+                      per_page: Optional[int] = None,
+                      **settings: Any) -> RepoAggregate:
+    """Aggregates the repos of each client, streaming them page by
+    page when per_page is given"""
+    aggregate = RepoAggregate(**settings)
+    for client in clients:
+        aggregate.add_many(client.iter_repos(per_page), client._org_name)
+    return aggregate
+
+
+def _aggregate_chunk(org_names: List[str], per_page: Optional[int],
+                     settings: Dict[str, Any]) -> RepoAggregate:
+    """Worker: partial aggregate of a chunk of orgs"""
+    return aggregate_clients(map(GithubOrgClient, org_names), per_page,
+                             **settings)
+
+
+def aggregate_orgs(org_names: Iterable[str], workers: Optional[int] = None,
+                   chunk_size: int = 50, per_page: Optional[int] = None,
+                   **settings: Any) -> RepoAggregate:
+    """Aggregates many orgs across a process pool: each worker reduces
+    chunk_size orgs to a partial aggregate and the partials are merged
+    as they arrive"""
+    names = list(org_names)
+    chunks = [names[i:i + chunk_size]
+              for i in range(0, len(names), chunk_size)]
+    total = RepoAggregate(**settings)
+    with ProcessPoolExecutor(workers) as pool:
+        for partial in pool.map(_aggregate_chunk, chunks,
+                                [per_page] * len(chunks),
+                                [settings] * len(chunks)):
+            total.merge(partial)
+    return total
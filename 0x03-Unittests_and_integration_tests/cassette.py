@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Record and replay HTTP traffic for ``utils.get_json``.
+
+A cassette is a gzipped NDJSON file holding one interaction per line:
+the request URL and headers, the response status and headers (as sent,
+so Content-Encoding still names the wire encoding), the decoded body
+(base64, so any bytes round-trip), the bytes it took on the wire and
+how long it took. Install a transport with ``utils.TRANSPORT`` (or
+pass ``transport=``)::
+
+    with RecordingTransport("google.cassette.gz") as recorder:
+        utils.TRANSPORT = recorder
+        GithubOrgClient("google").public_repos()
+
+    utils.TRANSPORT = ReplayTransport("google.cassette.gz", scale=0)
+"""
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import utils
+
+__all__ = [
+    "CassetteMiss",
+    "CassetteResponse",
+    "RecordingTransport",
+    "ReplayTransport",
+    "read_cassette",
+]
+
+
+class CassetteMiss(requests.RequestException):
+    """Raised when a replayed request has no recorded interaction"""
+
+
+class _Wire:
+    """Stand-in for urllib3's response, reporting recorded wire bytes"""
+
+    def __init__(self, wire_bytes: int) -> None:
+        """Init method of _Wire"""
+        self.wire_bytes = wire_bytes
+
+    def tell(self) -> int:
+        """Bytes the original response took on the wire"""
+        return self.wire_bytes
+
+
+class CassetteResponse:
+    """Requests-like response over an in-memory body"""
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str],
+                 body: bytes, elapsed: float, wire_bytes: int) -> None:
+        """Init method of CassetteResponse"""
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = body
+        self.elapsed = elapsed
+        self.raw = _Wire(wire_bytes)
+
+    @classmethod
+    def read(cls, url: str, response: Any, started: float,
+             max_bytes: Optional[int] = None) -> "CassetteResponse":
+        """Reads and closes a streamed response, keeping its body, wire
+        size and the time since `started` (a time.monotonic value).
+        Like get_json, stops with ResponseTooLargeError as soon as the
+        body passes max_bytes (utils.MAX_BYTES by default)."""
+        if max_bytes is None:
+            max_bytes = utils.MAX_BYTES
+        try:
+            body, wire_bytes = utils._read_body(response, max_bytes)
+        finally:
+            response.close()
+        return cls(url, response.status_code, dict(response.headers), body,
+                   time.monotonic() - started, wire_bytes)
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """Yields the body in chunk_size pieces"""
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def json(self) -> Any:
+        """Decoded JSON body"""
+        return json.loads(self.content)
+
+    def close(self) -> None:
+        """Nothing to release"""
+
+
+def _decode_body(interaction: Dict[str, Any]) -> bytes:
+    """Body bytes of a stored interaction"""
+    if interaction.get("body_encoding") == "base64":
+        return base64.b64decode(interaction["body"])
+    return interaction["body"].encode("utf-8")
+
+
+def read_cassette(path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily reads the interactions stored at path"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RecordingTransport:
+    """Forwards requests to `transport` and appends every interaction
+    to the cassette at path. Bodies are read fully before returning, so
+    the recorded time covers the whole transfer."""
+
+    def __init__(self, path: str, transport: Any = None) -> None:
+        """Init method of RecordingTransport"""
+        self.path = path
+        self.transport = transport
+        self._file = gzip.open(path, "at", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> CassetteResponse:
+        """requests.get, recorded"""
+        transport = requests if self.transport is None else self.transport
+        started = time.monotonic()
+        response = CassetteResponse.read(
+            url, transport.get(url, **kwargs), started)
+        line = json.dumps({
+            "url": url,
+            "request_headers": dict(kwargs.get("headers") or {}),
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "body": base64.b64encode(response.content).decode("ascii"),
+            "body_encoding": "base64",
+            "elapsed": response.elapsed,
+            "wire_bytes": response.raw.tell(),
+        }, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+        return response
+
+    def close(self) -> None:
+        """Flushes and closes the cassette"""
+        self._file.close()
+
+    def __enter__(self) -> "RecordingTransport":
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Context manager exit"""
+        self.close()
+
+
+class ReplayTransport:
+    """Serves the interactions of a cassette without any network.
+
+    Interactions for the same URL are replayed in recording order; once
+    exhausted, the last one keeps being served. Each response is held
+    back for its recorded time multiplied by `scale` (0 for none).
+    Example
+    -------
+    >>> utils.TRANSPORT = ReplayTransport("google.cassette.gz", scale=0.5)
+    """
+
+    def __init__(self, path: str, scale: float = 1.0,
+                 sleep: Callable[[float], Any] = time.sleep) -> None:
+        """Init method of ReplayTransport"""
+        self.scale = scale
+        self.sleep = sleep
+        self.requests: List[str] = []
+        self._interactions: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        for interaction in read_cassette(path):
+            self._interactions.setdefault(
+                interaction["url"], deque()).append(interaction)
+
+    def get(self, url: str, **kwargs: Any) -> CassetteResponse:
+        """Recorded response to url"""
+        with self._lock:
+            self.requests.append(url)
+            recorded = self._interactions.get(url)
+            if not recorded:
+                raise CassetteMiss("no recorded interaction for " + url)
+            interaction = (recorded.popleft() if len(recorded) > 1
+                           else recorded[0])
+        if self.scale:
+            self.sleep(interaction["elapsed"] * self.scale)
+        return CassetteResponse(url, interaction["status"],
+                                interaction["headers"],
+                                _decode_body(interaction),
+                                interaction["elapsed"],
+                                interaction["wire_bytes"])
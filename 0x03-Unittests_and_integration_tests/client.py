@@ -1,9 +1,22 @@
 #!/usr/bin/env python3
 """A github org client
 """
+import csv
+import heapq
+import json
+import operator
+from contextlib import contextmanager
 from typing import (
-    List,
+    Any,
+    Callable,
     Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
 )
 
 from utils import (
@@ -12,20 +25,110 @@ from utils import (
     memoize,
 )
 
+EXPORT_BUFFER_SIZE = 1 << 16
+
+
+@contextmanager
+def _open_sink(out: Any) -> Iterator[TextIO]:
+    """Buffered text stream for a path, a socket or a text file object.
+    Files opened from a path are closed on exit; for a socket only the
+    makefile wrapper is (flushing it), the socket stays open for the
+    caller. File objects are flushed and left open."""
+    if isinstance(out, str):
+        stream = open(out, "w", buffering=EXPORT_BUFFER_SIZE, newline="")
+    elif hasattr(out, "makefile"):
+        stream = out.makefile("w", buffering=EXPORT_BUFFER_SIZE,
+                              encoding="utf-8", newline="")
+    else:
+        yield out
+        out.flush()
+        return
+    with stream:
+        yield stream
+
+
+def _select(repo: Dict, fields: Sequence[str]) -> Dict[str, Any]:
+    """Values of the dotted `fields` of repo, None where missing"""
+    selected = {}
+    for field in fields:
+        try:
+            selected[field] = access_nested_map(repo, field.split("."))
+        except (KeyError, TypeError):
+            selected[field] = None
+    return selected
+
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda value, options: value in options,
+}
+_MISSING = object()
+
+
+def _getter(field: str) -> Callable[[Dict], Any]:
+    """Compiled lookup of a dotted field, _MISSING when absent"""
+    path = field.split(".")
+    if len(path) == 1:
+        return lambda repo: repo.get(field, _MISSING)
+
+    def get(repo: Dict) -> Any:
+        try:
+            return access_nested_map(repo, path)
+        except (KeyError, TypeError):
+            return _MISSING
+    return get
+
+
+def _compile_condition(field: str, condition: Any) -> Callable[[Dict], bool]:
+    """Predicate for one `where` entry: a value (equality), a callable
+    taking the field value, or a dict of operator -> operand"""
+    get = _getter(field)
+    if callable(condition):
+        return lambda repo: condition(get(repo))
+    if not isinstance(condition, dict):
+        return lambda repo: get(repo) == condition
+    tests = [(_OPERATORS[op], operand) for op, operand in condition.items()]
+
+    def matches(repo: Dict) -> bool:
+        value = get(repo)
+        if value is _MISSING:
+            return False
+        try:
+            return all(test(value, operand) for test, operand in tests)
+        except TypeError:
+            return False
+    return matches
+
 
 class GithubOrgClient:
     """A Githib org client
     """
     ORG_URL = "https://api.github.com/orgs/{org}"
+    # GitHub silently serves at most this many repos per page
+    MAX_PER_PAGE = 100
 
-    def __init__(self, org_name: str) -> None:
-        """Init method of GithubOrgClient"""
+    def __init__(self, org_name: str, transport: Any = None) -> None:
+        """Init method of GithubOrgClient.
+        transport is passed on to get_json (see transports.Transport);
+        None keeps get_json's default."""
         self._org_name = org_name
+        self._transport = transport
+
+    def _get_json(self, url: str) -> Any:
+        """get_json through this client's transport"""
+        if self._transport is None:
+            return get_json(url)
+        return get_json(url, transport=self._transport)
 
     @memoize
     def org(self) -> Dict:
         """Memoize org"""
-        return get_json(self.ORG_URL.format(org=self._org_name))
+        return self._get_json(self.ORG_URL.format(org=self._org_name))
 
     @property
     def _public_repos_url(self) -> str:
@@ -35,7 +138,7 @@ class GithubOrgClient:
     @memoize
     def repos_payload(self) -> Dict:
         """Memoize repos payload"""
-        return get_json(self._public_repos_url)
+        return self._get_json(self._public_repos_url)
 
     def public_repos(self, license: str = None) -> List[str]:
         """Public repos"""
@@ -47,6 +150,145 @@ class GithubOrgClient:
 
         return public_repos
 
+    def _index(self, field: str) -> Dict[Any, List[int]]:
+        """Secondary index of repos_payload positions by field value,
+        built on first use and kept for the life of the client"""
+        if not hasattr(self, "_indexes"):
+            self._indexes: Dict[str, Dict[Any, List[int]]] = {}
+        if field not in self._indexes:
+            get = _getter(field)
+            index: Dict[Any, List[int]] = {}
+            for position, repo in enumerate(self.repos_payload):
+                value = get(repo)
+                if isinstance(value, Hashable):
+                    index.setdefault(value, []).append(position)
+            self._indexes[field] = index
+        return self._indexes[field]
+
+    def query(self, where: Optional[Dict[str, Any]] = None,
+              select: Optional[Sequence[str]] = None,
+              order_by: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Dict]:
+        """Filter, sort and project repos_payload.
+        where maps dotted fields to a value (equality), a callable or a
+        dict of operators ("==", "!=", "<", "<=", ">", ">=", "in"), e.g.
+        {"fork": False, "stargazers_count": {">=": 10}}. The first plain
+        equality is answered from a secondary index (e.g. on
+        "license.key"). order_by is a field, prefixed with "-" for
+        descending order; with limit only the top `limit` repos are
+        selected, without a full sort. select lists the fields to return.
+        Example
+        -------
+        >>> client.query(where={"license.key": "apache-2.0"},
+        ...              select=["name", "stargazers_count"],
+        ...              order_by="-stargazers_count", limit=3)
+        """
+        where = dict(where or {})
+        repos: Iterable[Dict] = self.repos_payload
+        indexed = next((field for field, condition in where.items()
+                        if not callable(condition)
+                        and not isinstance(condition, dict)
+                        and isinstance(condition, Hashable)), None)
+        if indexed is not None:
+            value = where.pop(indexed)
+            payload = self.repos_payload
+            repos = [payload[i] for i in self._index(indexed).get(value, ())]
+        predicates = [_compile_condition(field, condition)
+                      for field, condition in where.items()]
+        if predicates:
+            repos = (repo for repo in repos
+                     if all(test(repo) for test in predicates))
+
+        if order_by:
+            descending = order_by.startswith("-")
+            get = _getter(order_by.lstrip("-"))
+
+            def key(repo: Dict) -> Any:
+                # missing values sort last in either direction
+                value = get(repo)
+                if value is _MISSING or value is None:
+                    return (not descending, None)
+                return (descending, value)
+            if limit is not None:
+                pick = heapq.nlargest if descending else heapq.nsmallest
+                repos = pick(limit, repos, key=key)
+            else:
+                repos = sorted(repos, key=key, reverse=descending)
+        elif limit is not None:
+            repos = (repo for _, repo in zip(range(limit), repos))
+
+        if select is None:
+            return list(repos)
+        return [_select(repo, select) for repo in repos]
+
+    def iter_repos(self, per_page: Optional[int] = None) -> Iterator[Dict]:
+        """Iterate over the org's repos.
+        Without per_page this walks the memoized repos_payload; with it,
+        repos are fetched page by page and never held all at once.
+        per_page is capped at MAX_PER_PAGE, GitHub's own limit.
+        """
+        if per_page is None:
+            yield from self.repos_payload
+            return
+        per_page = min(per_page, self.MAX_PER_PAGE)
+        page = 1
+        while True:
+            batch = self._get_json("{}?per_page={}&page={}".format(
+                self._public_repos_url, per_page, page))
+            yield from batch
+            if len(batch) < per_page:
+                return
+            page += 1
+
+    def export_repos(self, out: Any, fields: Sequence[str] = ("name",),
+                     fmt: str = "ndjson", license: str = None,
+                     per_page: Optional[int] = None) -> int:
+        """Stream the selected repo fields to out, one repo at a time.
+        out is a path, a connected socket or a text file object; fields
+        may be dotted paths such as "license.key"; fmt is "ndjson" or
+        "csv" (with a header row). Returns the number of repos written.
+        """
+        return self._export([self], out, fields, fmt, license, per_page,
+                            org_field=None)
+
+    @classmethod
+    def export_orgs(cls, org_names: Iterable[str], out: Any,
+                    fields: Sequence[str] = ("name",), fmt: str = "ndjson",
+                    license: str = None, per_page: Optional[int] = None,
+                    org_field: Optional[str] = "org") -> int:
+        """export_repos for several orgs into a single stream; each row
+        gets the org name under org_field unless it is None."""
+        return cls._export(map(cls, org_names), out, fields, fmt, license,
+                           per_page, org_field)
+
+    @classmethod
+    def _export(cls, clients: Iterable["GithubOrgClient"], out: Any,
+                fields: Sequence[str], fmt: str, license: Optional[str],
+                per_page: Optional[int], org_field: Optional[str]) -> int:
+        """Shared implementation of export_repos and export_orgs"""
+        if fmt not in ("ndjson", "csv"):
+            raise ValueError("unknown export format: {}".format(fmt))
+        columns = ([org_field] if org_field else []) + list(fields)
+        written = 0
+        with _open_sink(out) as stream:
+            if fmt == "csv":
+                writer = csv.DictWriter(stream, columns)
+                writer.writeheader()
+                write = writer.writerow
+            else:
+                def write(row: Dict[str, Any]) -> None:
+                    stream.write(json.dumps(row, separators=(",", ":")))
+                    stream.write("\n")
+            for client in clients:
+                for repo in client.iter_repos(per_page):
+                    if license is None or cls.has_license(repo, license):
+                        row = _select(repo, fields)
+                        if org_field:
+                            row = dict({org_field: client._org_name}, **row)
+                        write(row)
+                        written += 1
+        return written
+
     @staticmethod
     def has_license(repo: Dict[str, Dict], license_key: str) -> bool:
         """Static: has_license"""
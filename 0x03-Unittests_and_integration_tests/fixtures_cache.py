@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Binary cache of the test fixtures.
+"""
+import mmap
+import os
+import pickle
+from typing import Any
+
+__all__ = [
+    "CACHE_PATH",
+    "load_test_payload",
+    "TEST_PAYLOAD",
+]
+
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "fixtures.py")
+CACHE_PATH = os.path.join(os.path.dirname(FIXTURES_PATH),
+                          ".fixtures.pickle")
+
+
+def _write_cache(payload: Any, path: str) -> None:
+    """Atomically writes payload so concurrent workers never see a
+    partial file"""
+    tmp = "{}.{}".format(path, os.getpid())
+    with open(tmp, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def load_test_payload(path: str = CACHE_PATH) -> Any:
+    """Load ``fixtures.TEST_PAYLOAD`` from a pickle cache.
+    The cache is memory-mapped and unpickled in one pass, which is much
+    cheaper than executing the fixture literals. It is rebuilt from
+    ``fixtures.py`` when missing or older than it; if it cannot be
+    written the fixtures are simply imported.
+    Parameters
+    ----------
+    path: str
+        location of the cache file
+    """
+    try:
+        if os.path.getmtime(path) >= os.path.getmtime(FIXTURES_PATH):
+            with open(path, "rb") as f, mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return pickle.loads(mapped)
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+        pass
+    from fixtures import TEST_PAYLOAD as payload
+    try:
+        _write_cache(payload, path)
+    except OSError:
+        pass
+    return payload
+
+
+TEST_PAYLOAD = load_test_payload()
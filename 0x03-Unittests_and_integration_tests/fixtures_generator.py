@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Synthetic org fixtures shaped like ``fixtures.TEST_PAYLOAD``.
+"""
+import argparse
+import json
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from fixtures_cache import TEST_PAYLOAD
+
+__all__ = [
+    "org_payload",
+    "license_distribution",
+    "generate_repos",
+    "write_repos",
+    "read_repos",
+]
+
+ORG_URL = "https://api.github.com/orgs/{org}"
+_EPOCH = datetime(2008, 1, 1, tzinfo=timezone.utc)
+_SPAN = int((datetime(2020, 1, 1, tzinfo=timezone.utc)
+             - _EPOCH).total_seconds())
+
+
+def org_payload(org: str) -> Dict:
+    """Org payload as returned by ``GithubOrgClient.org``"""
+    url = ORG_URL.format(org=org)
+    return {"login": org, "url": url, "repos_url": url + "/repos"}
+
+
+def license_distribution(repos: Sequence[Dict] = TEST_PAYLOAD[0][1]
+                         ) -> Tuple[List[Optional[Dict]], List[int]]:
+    """Distinct license dicts (None for unlicensed) and their counts"""
+    licenses: Dict[Optional[str], Optional[Dict]] = {}
+    counts: Dict[Optional[str], int] = {}
+    for repo in repos:
+        license = repo.get("license")
+        key = license["key"] if license else None
+        licenses[key] = license
+        counts[key] = counts.get(key, 0) + 1
+    return list(licenses.values()), [counts[key] for key in licenses]
+
+
+def _timestamp(rng: random.Random) -> str:
+    """Random ISO-8601 UTC timestamp in the fixture's date range"""
+    moment = _EPOCH + timedelta(seconds=rng.randrange(_SPAN))
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def generate_repos(count: int, seed: int = 0, org: str = "google",
+                   templates: Sequence[Dict] = TEST_PAYLOAD[0][1]
+                   ) -> Iterator[Dict]:
+    """Lazily generate `count` repos for `org`.
+    Each repo is a copy of a fixture repo (cycled) with a unique name
+    and id, URLs rewritten for the new name, and license, fork flag,
+    counters and timestamps drawn with `seed` from the fixture's
+    distribution. Nested dicts such as ``owner`` and ``license`` are
+    shared between repos and must be treated as read-only.
+    Parameters
+    ----------
+    count: int
+        number of repos to generate
+    seed: int
+        seed of the random generator; equal seeds give equal output
+    """
+    rng = random.Random(seed)
+    licenses, weights = license_distribution(templates)
+    fork_rate = sum(bool(t.get("fork")) for t in templates) / len(templates)
+    login = templates[0]["owner"]["login"]
+    owner = {
+        key: value.replace(login, org) if isinstance(value, str) else value
+        for key, value in templates[0]["owner"].items()
+    }
+    for index in range(count):
+        template = templates[index % len(templates)]
+        name = "{}-{}".format(template["name"], index)
+        old = template["full_name"]
+        new = "{}/{}".format(org, name)
+        repo = {
+            key: value.replace(old, new) if isinstance(value, str) else value
+            for key, value in template.items()
+        }
+        stars = int(rng.paretovariate(1.2)) - 1
+        created = _timestamp(rng)
+        pushed = max(created, _timestamp(rng))
+        repo.update({
+            "id": 10 ** 8 + index,
+            "name": name,
+            "full_name": new,
+            "owner": owner,
+            "fork": rng.random() < fork_rate,
+            "license": rng.choices(licenses, weights)[0],
+            "stargazers_count": stars,
+            "watchers_count": stars,
+            "watchers": stars,
+            "forks_count": stars // 3,
+            "forks": stars // 3,
+            "created_at": created,
+            "pushed_at": pushed,
+            "updated_at": max(pushed, _timestamp(rng)),
+        })
+        yield repo
+
+
+def write_repos(repos: Iterable[Dict], out: Any, fmt: str = "ndjson") -> int:
+    """Stream repos to the text file `out` as NDJSON (one repo per line)
+    or as a JSON array, never holding more than one repo in memory.
+    Returns the number of repos written."""
+    if fmt not in ("ndjson", "json"):
+        raise ValueError("unknown format: {}".format(fmt))
+    written = 0
+    if fmt == "json":
+        out.write("[")
+    for repo in repos:
+        if fmt == "json" and written:
+            out.write(",\n")
+        out.write(json.dumps(repo, separators=(",", ":")))
+        if fmt == "ndjson":
+            out.write("\n")
+        written += 1
+    if fmt == "json":
+        out.write("]\n")
+    return written
+
+
+def read_repos(lines: Iterable[str]) -> Iterator[Dict]:
+    """Lazily parse NDJSON lines written by write_repos"""
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="write a synthetic org's repos payload")
+    parser.add_argument("count", type=int)
+    parser.add_argument("path", help="output file, - for stdout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--org", default="google")
+    parser.add_argument("--format", choices=["ndjson", "json"],
+                        default="ndjson")
+    args = parser.parse_args(argv)
+    repos = generate_repos(args.count, args.seed, args.org)
+    if args.path == "-":
+        write_repos(repos, sys.stdout, args.format)
+    else:
+        with open(args.path, "w", buffering=1 << 20) as out:
+            write_repos(repos, out, args.format)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Parallel unittest runner sharding test classes across processes.
+
+Usage::
+
+    python run_tests.py [-j WORKERS] [--slowest N] [-p PATTERN]
+
+Each test class runs entirely inside one worker, so ``setUpClass`` and
+``tearDownClass`` behave as with ``python -m unittest``.
+"""
+import argparse
+import os
+import sys
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class TimedResult(unittest.TestResult):
+    """TestResult recording the wall-clock duration of every test"""
+
+    def __init__(self) -> None:
+        """Init method of TimedResult"""
+        super().__init__()
+        self.durations: List[Tuple[str, float]] = []
+        self._started = 0.0
+
+    def startTest(self, test: unittest.TestCase) -> None:
+        """Starts the clock for test"""
+        super().startTest(test)
+        self._started = time.perf_counter()
+
+    def stopTest(self, test: unittest.TestCase) -> None:
+        """Records how long test took"""
+        self.durations.append(
+            (test.id(), time.perf_counter() - self._started))
+        super().stopTest(test)
+
+
+def iter_tests(suite: unittest.TestSuite) -> Iterator[unittest.TestCase]:
+    """Flattens nested suites into test cases"""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
+
+
+def shard_by_class(suite: unittest.TestSuite) -> List[List[str]]:
+    """Test ids grouped by their TestCase class, in discovery order"""
+    shards: Dict[str, List[str]] = {}
+    for test in iter_tests(suite):
+        test_id = test.id()
+        shards.setdefault(test_id.rsplit(".", 1)[0], []).append(test_id)
+    return list(shards.values())
+
+
+def run_shard(start_dir: str, test_ids: Sequence[str]) -> Dict[str, Any]:
+    """Runs test_ids in this process; returns a picklable summary"""
+    if start_dir not in sys.path:
+        sys.path.insert(0, start_dir)
+    result = TimedResult()
+    unittest.defaultTestLoader.loadTestsFromNames(test_ids).run(result)
+    return {
+        "run": result.testsRun,
+        "failures": [(t.id(), tb) for t, tb in result.failures],
+        "errors": [(getattr(t, "id", lambda: str(t))(), tb)
+                   for t, tb in result.errors],
+        "skipped": len(result.skipped),
+        "durations": result.durations,
+    }
+
+
+def run(start_dir: str = HERE, pattern: str = "test*.py",
+        workers: int = None) -> Dict[str, Any]:
+    """Discovers tests under start_dir and runs one class per task"""
+    if start_dir not in sys.path:
+        sys.path.insert(0, start_dir)
+    suite = unittest.defaultTestLoader.discover(start_dir, pattern)
+    shards = shard_by_class(suite)
+    total: Dict[str, Any] = {"run": 0, "failures": [], "errors": [],
+                             "skipped": 0, "durations": []}
+    with ProcessPoolExecutor(workers) as pool:
+        for summary in pool.map(run_shard, [start_dir] * len(shards),
+                                shards):
+            total["run"] += summary["run"]
+            total["skipped"] += summary["skipped"]
+            for key in ("failures", "errors", "durations"):
+                total[key].extend(summary[key])
+    return total
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("-p", "--pattern", default="test*.py")
+    parser.add_argument("-s", "--start-dir", default=HERE)
+    parser.add_argument("--slowest", type=int, default=10,
+                        help="number of slowest tests to list")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    total = run(os.path.abspath(args.start_dir), args.pattern, args.workers)
+    elapsed = time.perf_counter() - started
+
+    for kind in ("failures", "errors"):
+        for test_id, traceback in total[kind]:
+            print("=" * 70)
+            print("{}: {}".format(kind[:-1].upper(), test_id))
+            print("-" * 70)
+            print(traceback)
+    if args.slowest:
+        print("Slowest tests:")
+        slowest = sorted(total["durations"], key=lambda d: d[1],
+                         reverse=True)[:args.slowest]
+        for test_id, duration in slowest:
+            print("  {:8.4f}s  {}".format(duration, test_id))
+    failed = len(total["failures"]) + len(total["errors"])
+    print("Ran {} tests in {:.3f}s ({} skipped)".format(
+        total["run"], elapsed, total["skipped"]))
+    print("FAILED ({} problems)".format(failed) if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
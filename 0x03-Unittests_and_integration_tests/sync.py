@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Incremental sync of an org's repos into a local snapshot.
+"""
+import json
+import os
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from client import GithubOrgClient
+
+__all__ = [
+    "SyncResult",
+    "RepoSync",
+]
+
+
+class SyncResult(NamedTuple):
+    """Names of the repos that changed during one sync"""
+    added: List[str]
+    changed: List[str]
+    removed: List[str]
+    fetched: int
+    full: bool
+
+
+class RepoSync:
+    """Keeps a JSON snapshot of an org's repos up to date.
+
+    The snapshot stores every repo by id plus a high-water mark, the
+    newest ``updated_at`` seen. Later syncs ask GitHub for the repos
+    sorted by ``updated_at`` (newest first), page by page, and stop at
+    the first page reaching the high-water mark, so a quiet org costs
+    one page. Deletions cannot be seen in that listing; they are
+    detected by comparing the snapshot size with the org's
+    ``public_repos`` count, fetched afresh on every run, and trigger a
+    full listing.
+    Example
+    -------
+    >>> sync = RepoSync("google", "google.snapshot.json")
+    >>> result = sync.run()
+    >>> result.added, result.changed, result.removed
+    """
+
+    WATERMARK_FIELD = "updated_at"
+
+    def __init__(self, org_name: str, path: str, per_page: int = 100,
+                 client: Optional[GithubOrgClient] = None) -> None:
+        """Init method of RepoSync"""
+        self.path = path
+        self.per_page = min(per_page, GithubOrgClient.MAX_PER_PAGE)
+        self.client = client or GithubOrgClient(org_name)
+        self.snapshot = self.load()
+
+    def load(self) -> Dict[str, Any]:
+        """Read the snapshot, or an empty one if there is none yet"""
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"watermark": None, "repos": {}}
+
+    def save(self) -> None:
+        """Atomically write the snapshot"""
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.snapshot, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    @property
+    def repos(self) -> List[Dict]:
+        """Repos of the current snapshot"""
+        return list(self.snapshot["repos"].values())
+
+    def _pages(self, since: Optional[str]) -> Iterator[Dict]:
+        """Repos newest-updated first, stopping once past `since`"""
+        page = 1
+        while True:
+            batch = self.client._get_json(
+                "{}?sort=updated&direction=desc&per_page={}&page={}".format(
+                    self.client._public_repos_url, self.per_page, page))
+            for repo in batch:
+                if since is not None and repo[self.WATERMARK_FIELD] < since:
+                    return
+                yield repo
+            if len(batch) < self.per_page:
+                return
+            page += 1
+
+    def _refresh_org(self) -> None:
+        """Fetch the org payload again; the client memoizes it, so a
+        long-lived client would otherwise report a stale repo count"""
+        client = self.client
+        client._org = client._get_json(
+            client.ORG_URL.format(org=client._org_name))
+
+    def _expected_count(self) -> Optional[int]:
+        """Number of repos the org reports, if it reports one"""
+        count = self.client.org.get("public_repos")
+        return count if isinstance(count, int) else None
+
+    def run(self, full: bool = False) -> SyncResult:
+        """Fetch what changed since the last run, merge it into the
+        snapshot, save it and report the differences. full=True (or an
+        empty snapshot) lists every repo and also detects removals."""
+        self._refresh_org()
+        known = self.snapshot["repos"]
+        full = full or self.snapshot["watermark"] is None
+        since = None if full else self.snapshot["watermark"]
+        seen: Dict[str, Dict] = {}
+        for repo in self._pages(since):
+            seen[str(repo["id"])] = repo
+
+        if not full:
+            expected = self._expected_count()
+            merged = len(known) + sum(1 for key in seen if key not in known)
+            if expected is not None and expected != merged:
+                return self.run(full=True)
+
+        added = [r["name"] for k, r in seen.items() if k not in known]
+        changed = [r["name"] for k, r in seen.items()
+                   if k in known and known[k] != r]
+        removed: List[str] = []
+        if full:
+            removed = [r["name"] for k, r in known.items() if k not in seen]
+            known = {}
+        known.update(seen)
+        watermarks = [r[self.WATERMARK_FIELD] for r in seen.values()]
+        if self.snapshot["watermark"] and not full:
+            watermarks.append(self.snapshot["watermark"])
+        self.snapshot = {
+            "watermark": max(watermarks) if watermarks else None,
+            "repos": known,
+        }
+        self.save()
+        return SyncResult(added, changed, removed, len(seen), full)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Tests for aggregate module"""
+import pickle
+import unittest
+from unittest.mock import patch
+from aggregate import RepoAggregate, aggregate_clients
+from client import GithubOrgClient
+from fixtures_cache import TEST_PAYLOAD
+from fixtures_generator import generate_repos
+
+REPOS = TEST_PAYLOAD[0][1]
+
+
+class TestRepoAggregate(unittest.TestCase):
+    """Tests the RepoAggregate class"""
+
+    def test_groups_and_sums(self):
+        """Test license counts and forks/watchers totals"""
+        agg = RepoAggregate(top_k=0)
+        agg.add_many(REPOS, "google")
+        result = agg.result()
+        self.assertEqual(result["orgs"], 1)
+        self.assertEqual(result["repos"], len(REPOS))
+        self.assertEqual(result["groups"]["apache-2.0"]["count"], 4)
+        self.assertEqual(
+            sum(g["count"] for g in result["groups"].values()), len(REPOS))
+        self.assertEqual(result["sums"]["forks_count"],
+                         sum(r["forks_count"] for r in REPOS))
+        self.assertEqual(result["sums"]["watchers_count"],
+                         sum(r["watchers_count"] for r in REPOS))
+        self.assertEqual(result["top"], [])
+
+    def test_top_k(self):
+        """Test the bounded top-k by stars"""
+        agg = RepoAggregate(top_k=3)
+        agg.add_many(REPOS, "google")
+        expected = sorted(REPOS, key=lambda r: r["stargazers_count"],
+                          reverse=True)[:3]
+        self.assertEqual([r["name"] for r in agg.top()],
+                         [r["name"] for r in expected])
+        self.assertEqual(len(agg._top), 3)
+
+    def test_merge_matches_single_pass(self):
+        """Test partial aggregates merge to the single-pass result"""
+        repos = list(generate_repos(500, seed=1))
+        whole = RepoAggregate(top_k=5)
+        whole.add_many(repos, "google")
+        left, right = RepoAggregate(top_k=5), RepoAggregate(top_k=5)
+        left.add_many(repos[:200], "google")
+        right.add_many(repos[200:], "google")
+        merged = pickle.loads(pickle.dumps(left)).merge(
+            pickle.loads(pickle.dumps(right)))
+        result = merged.result()
+        result["orgs"] = 1
+        self.assertEqual(result, whole.result())
+
+    def test_merge_different_settings(self):
+        """Test merging aggregates with other settings raises"""
+        with self.assertRaises(ValueError):
+            RepoAggregate(top_k=3).merge(RepoAggregate(top_k=4))
+
+
+class TestAggregateClients(unittest.TestCase):
+    """Tests aggregate_clients over paginated repo streams"""
+
+    @patch("client.get_json")
+    def test_aggregate_clients(self, mock_get_json):
+        """Test several orgs are aggregated page by page"""
+        def get_json(url):
+            if "?" not in url:
+                return {"repos_url": url + "/repos"}
+            page = int(url.rsplit("page=", 1)[1])
+            return REPOS[(page - 1) * 3:page * 3]
+        mock_get_json.side_effect = get_json
+        clients = [GithubOrgClient(org) for org in ("a", "b")]
+        agg = aggregate_clients(clients, per_page=3, top_k=1)
+        self.assertEqual(agg.orgs, 2)
+        self.assertEqual(agg.repos, 2 * len(REPOS))
+        self.assertEqual(agg.groups["apache-2.0"]["count"], 8)
+        self.assertEqual(agg.top()[0]["org"], "b")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Tests for cassette module"""
+import base64
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, Mock
+from cassette import (
+    CassetteMiss,
+    RecordingTransport,
+    ReplayTransport,
+    read_cassette,
+)
+from client import GithubOrgClient
+from fixtures_cache import TEST_PAYLOAD
+from utils import TRANSFERS, get_json
+
+ORG_URL = "https://api.github.com/orgs/google"
+
+
+class FakeNetwork:
+    """Transport serving TEST_PAYLOAD as gzip-sized responses"""
+
+    def __init__(self):
+        """Init method of FakeNetwork"""
+        org, repos = TEST_PAYLOAD[0][:2]
+        self.routes = {ORG_URL: org, org["repos_url"]: repos}
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        """Stand-in for requests.get"""
+        self.calls += 1
+        body = json.dumps(self.routes[url]).encode()
+        return Mock(status_code=200, headers={"Content-Encoding": "gzip"},
+                    raw=Mock(**{"tell.return_value": len(body) // 4}),
+                    **{"iter_content.return_value": [body]})
+
+
+class TestCassette(unittest.TestCase):
+    """Records GithubOrgClient traffic and replays it offline"""
+
+    def setUp(self):
+        """Records one public_repos run into a fresh cassette"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "google.cassette.gz")
+        self.network = FakeNetwork()
+        with RecordingTransport(self.path, self.network) as recorder:
+            with patch("utils.TRANSPORT", recorder):
+                self.recorded = GithubOrgClient("google").public_repos()
+
+    def tearDown(self):
+        """Removes the cassette"""
+        self.tmp.cleanup()
+
+    def test_recorded_interactions(self):
+        """Test the cassette holds both requests with their metadata"""
+        interactions = list(read_cassette(self.path))
+        self.assertEqual([i["url"] for i in interactions],
+                         [ORG_URL, ORG_URL + "/repos"])
+        self.assertEqual(interactions[0]["status"], 200)
+        self.assertIn("Accept-Encoding", interactions[0]["request_headers"])
+        self.assertEqual(json.loads(base64.b64decode(
+            interactions[1]["body"])), TEST_PAYLOAD[0][1])
+
+    def test_replay(self):
+        """Test replaying gives identical results without the network"""
+        replay = ReplayTransport(self.path, scale=0)
+        with patch("utils.TRANSPORT", replay):
+            self.assertEqual(GithubOrgClient("google").public_repos(),
+                             self.recorded)
+        self.assertEqual(self.network.calls, 2)
+        self.assertEqual(replay.requests, [ORG_URL, ORG_URL + "/repos"])
+        self.assertEqual(TRANSFERS.last.encoding, "gzip")
+        self.assertLess(TRANSFERS.last.wire_bytes,
+                        TRANSFERS.last.decoded_bytes)
+
+    def test_scaled_latency(self):
+        """Test responses are delayed by the recorded time times scale"""
+        delays = []
+        replay = ReplayTransport(self.path, scale=2.5, sleep=delays.append)
+        get_json(ORG_URL, transport=replay)
+        elapsed = next(read_cassette(self.path))["elapsed"]
+        self.assertEqual(delays, [elapsed * 2.5])
+
+    def test_binary_body(self):
+        """Test a body that is not UTF-8 is recorded and replayed as is"""
+        body = b"\xff\xfe\x00binary"
+        network = Mock(**{"get.return_value": Mock(
+            status_code=200, headers={}, raw=None,
+            **{"iter_content.return_value": [body]})})
+        path = os.path.join(self.tmp.name, "binary.cassette.gz")
+        with RecordingTransport(path, network) as recorder:
+            self.assertEqual(recorder.get(ORG_URL).content, body)
+        replayed = ReplayTransport(path, scale=0).get(ORG_URL)
+        self.assertEqual(b"".join(replayed.iter_content(4)), body)
+
+    def test_miss(self):
+        """Test an unrecorded URL raises CassetteMiss"""
+        replay = ReplayTransport(self.path, scale=0)
+        with self.assertRaises(CassetteMiss):
+            get_json("https://api.github.com/orgs/abc", transport=replay)
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """Tests for client module"""
+import io
+import json
 import unittest
 from client import GithubOrgClient
 from parameterized import parameterized, parameterized_class
 from unittest.mock import patch, PropertyMock, Mock
-from fixtures import TEST_PAYLOAD
+from fixtures_cache import TEST_PAYLOAD
+from fixtures_generator import generate_repos, org_payload
 from requests import HTTPError
 
+SYNTHETIC_REPOS = list(generate_repos(1000, seed=42))
+
 
 class TestGithubOrgClient(unittest.TestCase):
     """Tests for GithubOrgCLient method org"""
@@ -83,6 +88,125 @@ class TestGithubOrgClient(unittest.TestCase):
         result = GithubOrgClient.has_license(repo, license_key)
         self.assertEqual(result, expected)
 
+    @patch('client.get_json')
+    def test_iter_repos_pages(self, mock_get_json):
+        """Test that iter_repos fetches pages until a short one"""
+        url = "https://api.github.com/orgs/test_org/repos"
+        pages = [[{"name": "a"}, {"name": "b"}], [{"name": "c"}]]
+        mock_get_json.side_effect = [{"repos_url": url}] + pages
+
+        client = GithubOrgClient("test_org")
+        names = [repo["name"] for repo in client.iter_repos(per_page=2)]
+
+        self.assertEqual(names, ["a", "b", "c"])
+        mock_get_json.assert_called_with(url + "?per_page=2&page=2")
+        self.assertEqual(mock_get_json.call_count, 3)
+
+    @patch('client.get_json')
+    def test_iter_repos_per_page_capped(self, mock_get_json):
+        """Test that per_page above GitHub's limit is capped, so a full
+        page of 100 is not mistaken for the last one"""
+        url = "https://api.github.com/orgs/test_org/repos"
+        pages = [[{"name": str(i)} for i in range(100)], [{"name": "x"}]]
+        mock_get_json.side_effect = [{"repos_url": url}] + pages
+
+        repos = list(GithubOrgClient("test_org").iter_repos(per_page=200))
+
+        self.assertEqual(len(repos), 101)
+        mock_get_json.assert_called_with(url + "?per_page=100&page=2")
+
+    @parameterized.expand([
+        ("ndjson", '{"name":"a","license.key":"mit"}\n'
+                   '{"name":"b","license.key":null}\n'),
+        ("csv", "name,license.key\r\na,mit\r\nb,\r\n"),
+    ])
+    def test_export_repos(self, fmt, expected):
+        """Test that export_repos writes the selected fields"""
+        client = GithubOrgClient("test_org")
+        out = io.StringIO()
+        with patch.object(GithubOrgClient, 'repos_payload',
+                          new_callable=PropertyMock) as mock_payload:
+            mock_payload.return_value = [
+                {"name": "a", "license": {"key": "mit"}},
+                {"name": "b", "license": None},
+            ]
+            count = client.export_repos(
+                out, fields=("name", "license.key"), fmt=fmt)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(out.getvalue(), expected)
+
+    @patch('client.get_json')
+    def test_export_orgs(self, mock_get_json):
+        """Test that export_orgs tags rows with the org and filters"""
+        payloads = {
+            "https://api.github.com/orgs/x": {"repos_url": "x/repos"},
+            "https://api.github.com/orgs/y": {"repos_url": "y/repos"},
+            "x/repos": [{"name": "x1", "license": {"key": "mit"}}],
+            "y/repos": [{"name": "y1", "license": {"key": "mit"}},
+                        {"name": "y2"}],
+        }
+        mock_get_json.side_effect = payloads.__getitem__
+        out = io.StringIO()
+
+        count = GithubOrgClient.export_orgs(["x", "y"], out, license="mit")
+
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            [json.loads(line) for line in out.getvalue().splitlines()],
+            [{"org": "x", "name": "x1"}, {"org": "y", "name": "y1"}])
+
+
+class TestGithubOrgClientQuery(unittest.TestCase):
+    """Tests for GithubOrgClient.query over the fixture repos"""
+
+    def setUp(self):
+        """Client whose repos_payload is the fixture payload"""
+        patcher = patch('client.GithubOrgClient.repos_payload',
+                        new_callable=PropertyMock,
+                        return_value=TEST_PAYLOAD[0][1])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = GithubOrgClient("google")
+
+    def names(self, **kwargs):
+        """Names of the repos returned by query(**kwargs)"""
+        return [repo["name"] for repo in self.client.query(**kwargs)]
+
+    def test_license_index(self):
+        """Test that equality on license.key matches public_repos"""
+        self.assertEqual(self.names(where={"license.key": "apache-2.0"}),
+                         TEST_PAYLOAD[0][3])
+        self.assertIn("license.key", self.client._indexes)
+
+    @parameterized.expand([
+        ({"stargazers_count": {">=": 8000}},
+         ["dagger", "traceur-compiler"]),
+        ({"language": {"in": ("Dart", "Java")}},
+         ["episodes.dart", "dagger"]),
+        ({"license.key": "apache-2.0", "forks_count": lambda n: n < 40},
+         ["kratu", "firmata.py"]),
+        ({"license.key": "no-such-license"}, []),
+    ])
+    def test_where(self, where, expected):
+        """Test operator, callable and combined conditions"""
+        self.assertEqual(self.names(where=where), expected)
+
+    def test_order_limit_select(self):
+        """Test top-k selection and projection"""
+        self.assertEqual(
+            self.client.query(select=["name", "stargazers_count"],
+                              order_by="-stargazers_count", limit=2),
+            [{"name": "dagger", "stargazers_count": 14492},
+             {"name": "traceur-compiler", "stargazers_count": 8033}])
+
+    def test_order_missing_last(self):
+        """Test that repos without the sort field come last"""
+        self.assertEqual(self.names(order_by="license.key")[-1],
+                         "google.github.io")
+        self.assertEqual(self.names(order_by="-license.key")[-1],
+                         "google.github.io")
+
 
 @parameterized_class([
     {
@@ -91,6 +215,15 @@ class TestGithubOrgClient(unittest.TestCase):
         'expected_repos': TEST_PAYLOAD[0][2],
         'apache2_repos': TEST_PAYLOAD[0][3],
     },
+    {
+        'org_payload': org_payload("google"),
+        'repos_payload': SYNTHETIC_REPOS,
+        'expected_repos': [repo["name"] for repo in SYNTHETIC_REPOS],
+        'apache2_repos': [
+            repo["name"] for repo in SYNTHETIC_REPOS
+            if repo["license"] and repo["license"]["key"] == "apache-2.0"
+        ],
+    },
 ])
 class TestIntegrationGithubOrgClient(unittest.TestCase):
     """Performs integration tests for the `GithubOrgClient` class."""
@@ -102,9 +235,12 @@ class TestIntegrationGithubOrgClient(unittest.TestCase):
             'https://api.github.com/orgs/google/repos': cls.repos_payload,
         }
 
-        def get_payload(url):
+        def get_payload(url, **kwargs):
             if url in route_payload:
-                return Mock(**{'json.return_value': route_payload[url]})
+                return Mock(status_code=200, raw=None, headers={}, **{
+                    'iter_content.return_value': [
+                        json.dumps(route_payload[url]).encode()],
+                })
             return HTTPError
 
         cls.get_patcher = patch("requests.get", side_effect=get_payload)
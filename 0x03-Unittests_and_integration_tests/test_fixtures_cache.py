@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Tests for the fixtures cache and the parallel test runner"""
+import os
+import tempfile
+import unittest
+import fixtures
+from fixtures_cache import load_test_payload
+from run_tests import shard_by_class
+
+
+class TestLoadTestPayload(unittest.TestCase):
+    """Tests for load_test_payload"""
+
+    def setUp(self):
+        """Points the cache at a fresh temporary file"""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "payload.pickle")
+
+    def test_builds_cache(self):
+        """First load imports the fixtures and writes the cache"""
+        self.assertEqual(load_test_payload(self.path), fixtures.TEST_PAYLOAD)
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_reads_cache(self):
+        """Later loads come from the cache file"""
+        load_test_payload(self.path)
+        self.assertEqual(load_test_payload(self.path), fixtures.TEST_PAYLOAD)
+
+    def test_rebuilds_stale_cache(self):
+        """A cache older than fixtures.py is replaced"""
+        load_test_payload(self.path)
+        os.utime(self.path, (0, 0))
+        self.assertEqual(load_test_payload(self.path), fixtures.TEST_PAYLOAD)
+        self.assertGreater(os.path.getmtime(self.path), 0)
+
+
+class TestShardByClass(unittest.TestCase):
+    """Tests for shard_by_class"""
+
+    def test_groups_by_class(self):
+        """Each shard holds the tests of exactly one class"""
+        suite = unittest.defaultTestLoader.loadTestsFromTestCase(
+            TestLoadTestPayload)
+        suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(
+            TestShardByClass))
+        shards = shard_by_class(suite)
+        self.assertEqual(len(shards), 2)
+        self.assertEqual(len(shards[0]), 3)
+        self.assertTrue(all(t.split(".")[-2] == "TestShardByClass"
+                            for t in shards[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Tests for fixtures_generator module"""
+import io
+import json
+import unittest
+from parameterized import parameterized
+from fixtures_cache import TEST_PAYLOAD
+from fixtures_generator import (
+    generate_repos,
+    license_distribution,
+    org_payload,
+    read_repos,
+    write_repos,
+)
+
+
+class TestGenerateRepos(unittest.TestCase):
+    """Tests for generate_repos"""
+
+    def test_same_seed_same_output(self):
+        """Generation is deterministic for a given seed"""
+        self.assertEqual(list(generate_repos(50, seed=3)),
+                         list(generate_repos(50, seed=3)))
+        self.assertNotEqual(list(generate_repos(50, seed=3)),
+                            list(generate_repos(50, seed=4)))
+
+    def test_shape_matches_fixture(self):
+        """Repos have the fixture's keys, unique names and ids"""
+        repos = list(generate_repos(100, org="acme"))
+        self.assertEqual(len(repos), 100)
+        self.assertEqual(len({r["name"] for r in repos}), 100)
+        self.assertEqual(len({r["id"] for r in repos}), 100)
+        for repo in repos:
+            self.assertEqual(repo.keys(), TEST_PAYLOAD[0][1][0].keys())
+            self.assertTrue(repo["full_name"].startswith("acme/"))
+            self.assertIn(repo["full_name"], repo["url"])
+            self.assertGreaterEqual(repo["updated_at"], repo["created_at"])
+
+    def test_licenses_from_fixture(self):
+        """Only licenses present in the fixture are used"""
+        licenses, weights = license_distribution()
+        self.assertEqual(sum(weights), len(TEST_PAYLOAD[0][1]))
+        for repo in generate_repos(200):
+            self.assertIn(repo["license"], licenses)
+
+
+class TestWriteRepos(unittest.TestCase):
+    """Tests for write_repos and read_repos"""
+
+    @parameterized.expand([
+        ("ndjson",),
+        ("json",),
+    ])
+    def test_round_trip(self, fmt):
+        """Written repos parse back to the generated ones"""
+        out = io.StringIO()
+        self.assertEqual(write_repos(generate_repos(20), out, fmt), 20)
+        if fmt == "json":
+            parsed = json.loads(out.getvalue())
+        else:
+            parsed = list(read_repos(io.StringIO(out.getvalue())))
+        self.assertEqual(parsed, list(generate_repos(20)))
+
+    def test_unknown_format(self):
+        """Unknown formats are rejected"""
+        with self.assertRaises(ValueError):
+            write_repos([], io.StringIO(), "xml")
+
+    def test_org_payload(self):
+        """org_payload points at the org's repos URL"""
+        self.assertEqual(org_payload("google")["repos_url"],
+                         TEST_PAYLOAD[0][0]["repos_url"])
+
+
+if __name__ == '__main__':
+    unittest.main()
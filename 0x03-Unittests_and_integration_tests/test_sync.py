@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Tests for sync module"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+from client import GithubOrgClient
+from sync import RepoSync
+
+ORG_URL = "https://api.github.com/orgs/test_org"
+REPOS_URL = ORG_URL + "/repos"
+
+
+class FakeGithub:
+    """Serves an org's repos sorted and paginated like the GitHub API"""
+
+    def __init__(self, repos):
+        """Init method of FakeGithub"""
+        self.repos = repos
+        self.requests = []
+
+    def get_json(self, url):
+        """Stand-in for utils.get_json"""
+        self.requests.append(url)
+        if url == ORG_URL:
+            return {"repos_url": REPOS_URL, "public_repos": len(self.repos)}
+        query = parse_qs(urlparse(url).query)
+        per_page, page = int(query["per_page"][0]), int(query["page"][0])
+        ordered = sorted(self.repos, key=lambda r: r["updated_at"],
+                         reverse=True)
+        return ordered[(page - 1) * per_page:page * per_page]
+
+
+def repo(repo_id, updated_at, name=None):
+    """Minimal repo payload"""
+    return {"id": repo_id, "name": name or "repo{}".format(repo_id),
+            "updated_at": updated_at}
+
+
+class TestRepoSync(unittest.TestCase):
+    """Tests for RepoSync"""
+
+    def setUp(self):
+        """Serves five repos and points the snapshot at a temp dir"""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "snapshot.json")
+        self.github = FakeGithub([
+            repo(i, "2020-01-0{}T00:00:00Z".format(i)) for i in range(1, 6)
+        ])
+        patcher = patch("client.get_json", side_effect=self.github.get_json)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sync(self):
+        """Runs a sync with a fresh client, as a new process would"""
+        return RepoSync("test_org", self.path, per_page=2).run()
+
+    def test_first_run_is_full(self):
+        """Test that the first sync lists and stores every repo"""
+        result = self.sync()
+        self.assertTrue(result.full)
+        self.assertEqual(sorted(result.added),
+                         ["repo1", "repo2", "repo3", "repo4", "repo5"])
+        self.assertEqual(RepoSync("test_org", self.path).snapshot["watermark"],
+                         "2020-01-05T00:00:00Z")
+
+    def test_quiet_run_fetches_one_page(self):
+        """Test that a sync without changes stops at the first page"""
+        self.sync()
+        self.github.requests.clear()
+        result = self.sync()
+        self.assertEqual(result.added + result.changed + result.removed, [])
+        self.assertFalse(result.full)
+        self.assertEqual(len(self.github.requests), 2)
+
+    def test_delta_run(self):
+        """Test that updated and new repos are merged into the snapshot"""
+        self.sync()
+        self.github.repos[0] = repo(1, "2020-02-01T00:00:00Z", "renamed")
+        self.github.repos.append(repo(6, "2020-02-02T00:00:00Z"))
+        result = self.sync()
+        self.assertFalse(result.full)
+        self.assertEqual(result.added, ["repo6"])
+        self.assertEqual(result.changed, ["renamed"])
+        self.assertEqual(result.fetched, 3)
+        sync = RepoSync("test_org", self.path)
+        self.assertEqual(len(sync.repos), 6)
+        self.assertEqual(sync.snapshot["watermark"], "2020-02-02T00:00:00Z")
+
+    def test_removal_triggers_full_run(self):
+        """Test that a repo count mismatch falls back to a full listing"""
+        self.sync()
+        del self.github.repos[1]
+        result = self.sync()
+        self.assertTrue(result.full)
+        self.assertEqual(result.removed, ["repo2"])
+        self.assertEqual(len(RepoSync("test_org", self.path).repos), 4)
+
+    def test_instance_reused(self):
+        """Test that a second run of the same instance sees removals"""
+        sync = RepoSync("test_org", self.path, per_page=2)
+        sync.run()
+        del self.github.repos[1]
+        result = sync.run()
+        self.assertTrue(result.full)
+        self.assertEqual(result.removed, ["repo2"])
+        self.assertNotIn("2", sync.snapshot["repos"])
+
+    def test_client_reused(self):
+        """Test that an existing client can be passed in"""
+        client = GithubOrgClient("test_org")
+        self.assertIs(RepoSync("x", self.path, client=client).client, client)
+
+
+if __name__ == '__main__':
+    unittest.main()
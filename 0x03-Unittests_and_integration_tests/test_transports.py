@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Tests for transports module"""
+import asyncio
+import json
+import threading
+import time
+import unittest
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from parameterized import parameterized
+from unittest.mock import patch, Mock
+from cassette import CassetteResponse
+from client import GithubOrgClient
+from fixtures_cache import TEST_PAYLOAD
+from transports import (
+    AsyncTransport,
+    CacheMiddleware,
+    CoalesceMiddleware,
+    FixtureTransport,
+    RetryMiddleware,
+    SessionTransport,
+    Transport,
+    Urllib3Transport,
+    chain,
+)
+from utils import ResponseTooLargeError, get_json
+
+ORG_URL = "https://api.github.com/orgs/google"
+ORG, REPOS, EXPECTED, APACHE2 = TEST_PAYLOAD[0]
+ROUTES = {ORG_URL: ORG, ORG["repos_url"]: REPOS}
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Answers every GET with its path as JSON"""
+
+    def do_GET(self):
+        """Echoes the path"""
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Keeps the test output quiet"""
+
+
+class FlakyTransport(FixtureTransport):
+    """Fails with a connection error the first `failures` times"""
+
+    def __init__(self, routes, failures):
+        """Init method of FlakyTransport"""
+        super().__init__(routes)
+        self.failures = failures
+
+    def get(self, url, **kwargs):
+        """Response to url once the failures are used up"""
+        if self.failures:
+            self.failures -= 1
+            raise requests.ConnectionError("connection reset")
+        return super().get(url, **kwargs)
+
+
+class TestNetworkTransports(unittest.TestCase):
+    """requests-session and urllib3 transports against a local server"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Starts the echo server"""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        cls.server.daemon_threads = True
+        cls.base = "http://127.0.0.1:{}".format(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever,
+                         daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stops the echo server"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    @parameterized.expand([
+        ("session", SessionTransport),
+        ("urllib3", Urllib3Transport),
+    ])
+    def test_get_json(self, _, transport_class):
+        """Test get_json works through the transport"""
+        transport = transport_class()
+        self.assertIsInstance(transport, Transport)
+        with patch("requests.get") as mock_get:
+            for page in range(3):
+                self.assertEqual(
+                    get_json(self.base + "/p{}".format(page),
+                             transport=transport),
+                    {"path": "/p{}".format(page)})
+            mock_get.assert_not_called()
+        transport.close()
+
+    def test_urllib3_errors(self):
+        """Test urllib3 failures surface as requests exceptions"""
+        with self.assertRaises(requests.ConnectionError):
+            Urllib3Transport().get("http://127.0.0.1:1/", timeout=(1, 1))
+
+
+class TestTransports(unittest.TestCase):
+    """In-memory, async and middleware transports"""
+
+    def test_protocol(self):
+        """Test the stock transports satisfy the protocol"""
+        self.assertIsInstance(requests, Transport)
+        self.assertIsInstance(FixtureTransport({}), Transport)
+        self.assertIsInstance(CacheMiddleware(requests), Transport)
+
+    def test_client_transport(self):
+        """Test GithubOrgClient uses its transport, not requests.get"""
+        transport = FixtureTransport(ROUTES)
+        with patch("requests.get") as mock_get:
+            client = GithubOrgClient("google", transport=transport)
+            self.assertEqual(client.public_repos(), EXPECTED)
+            self.assertEqual(client.public_repos("apache-2.0"), APACHE2)
+            mock_get.assert_not_called()
+        self.assertEqual(transport.requests, list(ROUTES))
+
+    def test_fixture_not_found(self):
+        """Test unknown URLs get a 404 payload"""
+        response = FixtureTransport({}).get(ORG_URL)
+        self.assertEqual(response.status_code, 404)
+
+    def test_async(self):
+        """Test many get_json calls in flight from one event loop"""
+        transport = AsyncTransport(FixtureTransport(ROUTES))
+
+        async def fetch_all():
+            return await asyncio.gather(
+                transport.get_json(ORG_URL),
+                *(transport.fetch(ORG["repos_url"]) for _ in range(3)),
+                asyncio.to_thread(GithubOrgClient(
+                    "google", transport=transport.transport).public_repos))
+        org, *responses, repos = asyncio.run(fetch_all())
+        self.assertEqual(org, ORG)
+        self.assertEqual([r.json() for r in responses], [REPOS] * 3)
+        self.assertEqual(repos, EXPECTED)
+        self.assertNotIsInstance(transport, Transport)
+
+    def test_chain(self):
+        """Test cache -> coalesce -> retry -> transport"""
+        sleeps = []
+        inner = FlakyTransport(ROUTES, failures=2)
+        transport = chain(
+            CacheMiddleware, CoalesceMiddleware,
+            partial(RetryMiddleware, backoff=0.5, sleep=sleeps.append),
+            inner)
+        for _ in range(3):
+            self.assertEqual(get_json(ORG_URL, transport=transport), ORG)
+        self.assertEqual(sleeps, [0.5, 1.0])
+        self.assertEqual(inner.requests, [ORG_URL])
+
+    def test_retry_gives_up(self):
+        """Test the last failure is raised once retries run out"""
+        transport = RetryMiddleware(FlakyTransport(ROUTES, failures=5),
+                                    retries=2, sleep=lambda _: None)
+        with self.assertRaises(requests.ConnectionError):
+            transport.get(ORG_URL)
+
+    def test_cache_ttl(self):
+        """Test cached responses expire after ttl seconds"""
+        now = [0.0]
+        inner = FixtureTransport(ROUTES)
+        cache = CacheMiddleware(inner, ttl=10, clock=lambda: now[0])
+        cache.get(ORG_URL)
+        now[0] = 9.0
+        cache.get(ORG_URL)
+        now[0] = 10.0
+        cache.get(ORG_URL)
+        self.assertEqual(len(inner.requests), 2)
+
+    @parameterized.expand([
+        ("cache", CacheMiddleware),
+        ("coalesce", CoalesceMiddleware),
+    ])
+    def test_buffering_respects_max_bytes(self, _, middleware):
+        """Test buffering middleware stop reading once past max_bytes"""
+        chunks = []
+
+        def stream(chunk_size):
+            for _ in range(1000):
+                chunks.append(chunk_size)
+                yield b" " * chunk_size
+        upstream = Mock(**{"get.return_value": Mock(
+            status_code=200, headers={}, raw=None,
+            **{"iter_content.side_effect": stream})})
+        with patch("utils.MAX_BYTES", 10 ** 5), \
+                self.assertRaises(ResponseTooLargeError):
+            get_json(ORG_URL, transport=middleware(upstream))
+        self.assertLess(sum(chunks), 2 * 10 ** 5)
+        upstream.get.return_value.close.assert_called()
+
+    def test_coalesce(self):
+        """Test concurrent requests for a URL share one upstream call"""
+        release = threading.Event()
+        inner = FixtureTransport(ROUTES)
+        upstream = inner.get
+
+        def slow_get(url, **kwargs):
+            release.wait(5)
+            return upstream(url, **kwargs)
+        inner.get = slow_get
+        transport = CoalesceMiddleware(inner)
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(transport.get(ORG_URL)))
+            for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(inner.requests), 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(isinstance(r, CassetteResponse)
+                            for r in results))
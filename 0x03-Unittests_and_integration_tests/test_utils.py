@@ -1,8 +1,24 @@
 #!/usr/bin/env python3
 """Parameterize a unit test"""
+import gzip
+import json
+import threading
+import time
 import unittest
+import requests
+import utils
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from parameterized import parameterized
-from utils import access_nested_map, get_json, memoize
+from utils import (
+    access_nested_map,
+    get_json,
+    memoize,
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyWindow,
+    ResponseTooLargeError,
+    TRANSFERS,
+)
 from unittest.mock import patch, Mock, MagicMock
 from functools import wraps
 from typing import Callable
@@ -39,12 +55,15 @@ class TestGetJson(unittest.TestCase):
     ])
     def test_get_json(self, test_url, test_payload):
         """Test that utils.get_json returns the expected result."""
-        mock_response = Mock()
-        mock_response.json.return_value = test_payload
+        mock_response = Mock(status_code=200, raw=None, headers={})
+        mock_response.iter_content.return_value = [
+            json.dumps(test_payload).encode()]
 
         with patch('requests.get', return_value=mock_response) as mock_get:
             result = get_json(test_url)
-            mock_get.assert_called_once_with(test_url)
+            mock_get.assert_called_once_with(
+                test_url, timeout=utils.TIMEOUT, stream=True,
+                headers={"Accept-Encoding": utils.ACCEPT_ENCODING})
             self.assertEqual(result, test_payload)
             mock_get.reset_mock()
 
@@ -72,5 +91,160 @@ class TestMemoize(unittest.TestCase):
             self.assertEqual(result2, 99)
 
 
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves /ok, /slow (sleeps), /error (500), /flaky (only the
+    first request is slow), /big (a large body, gzipped when the
+    client accepts it) and /missing (an HTML 404 page)"""
+
+    def do_GET(self):
+        """Answers according to the path"""
+        server = self.server
+        with server.lock:
+            server.hits += 1
+            hit = server.hits
+        if self.path == "/slow" or (self.path == "/flaky" and hit == 1):
+            time.sleep(server.delay)
+        status = {"/error": 500, "/missing": 404}.get(self.path, 200)
+        body = json.dumps({"hit": hit}).encode()
+        self.send_response(status)
+        if self.path == "/missing":
+            body = b"<html><body>Not Found</body></html>"
+        if self.path == "/big":
+            body = json.dumps([{"name": "repo"}] * 10000).encode()
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        """Keeps the test output quiet"""
+
+
+class TestGetJsonResilience(unittest.TestCase):
+    """Timeouts, circuit breaking and hedging against a stub server"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Starts the stub server"""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.server.delay = 0.5
+        cls.base = "http://127.0.0.1:{}".format(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever,
+                         daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stops the stub server"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Fresh per-host state for every test"""
+        self.server.hits = 0
+        utils._breakers.clear()
+        utils._latencies.clear()
+
+    def test_ok(self):
+        """Test a plain request against the stub"""
+        self.assertEqual(get_json(self.base + "/ok"), {"hit": 1})
+
+    def test_read_timeout(self):
+        """Test a hanging response is cut off by the read timeout"""
+        with self.assertRaises(requests.Timeout):
+            get_json(self.base + "/slow", timeout=(1, 0.05))
+
+    def test_breaker_opens(self):
+        """Test the host is no longer called once its circuit opens"""
+        for _ in range(utils.BREAKER_THRESHOLD):
+            get_json(self.base + "/error")
+        with self.assertRaises(CircuitOpenError):
+            get_json(self.base + "/ok")
+        self.assertEqual(self.server.hits, utils.BREAKER_THRESHOLD)
+
+    def test_non_json_404(self):
+        """Test an HTML error page below 500 does not open the circuit"""
+        for _ in range(utils.BREAKER_THRESHOLD + 1):
+            with self.assertRaises(requests.JSONDecodeError):
+                get_json(self.base + "/missing")
+        self.assertEqual(get_json(self.base + "/ok"),
+                         {"hit": utils.BREAKER_THRESHOLD + 2})
+
+    def test_hedged_request(self):
+        """Test a slow first response is overtaken by the duplicate"""
+        for _ in range(utils.HEDGE_MIN_SAMPLES):
+            get_json(self.base + "/ok")
+        self.server.hits = 0
+        started = time.monotonic()
+        result = get_json(self.base + "/flaky", hedge=True)
+        self.assertLess(time.monotonic() - started, self.server.delay)
+        self.assertEqual(result, {"hit": 2})
+
+    def test_compressed_transfer(self):
+        """Test gzip is negotiated and both byte counts are recorded"""
+        before = TRANSFERS.wire_bytes
+        self.assertEqual(len(get_json(self.base + "/big")), 10000)
+        transfer = TRANSFERS.last
+        self.assertEqual(transfer.encoding, "gzip")
+        self.assertEqual(transfer.decoded_bytes,
+                         len(json.dumps([{"name": "repo"}] * 10000)))
+        self.assertLess(transfer.wire_bytes, transfer.decoded_bytes / 10)
+        self.assertEqual(TRANSFERS.wire_bytes - before, transfer.wire_bytes)
+
+    def test_max_bytes(self):
+        """Test a body decoding past max_bytes is abandoned"""
+        with self.assertRaises(ResponseTooLargeError):
+            get_json(self.base + "/big", max_bytes=50000)
+        self.assertEqual(utils._breakers[self.base[7:]].failures, 0)
+
+    def test_half_open_inconclusive_trial(self):
+        """Test a half-open trial ending in an oversized body or a
+        non-HTTP error does not keep the circuit open"""
+        now = [0.0]
+        host = self.base[7:]
+        utils._breakers[host] = breaker = CircuitBreaker(
+            1, 10, clock=lambda: now[0])
+        utils._latencies[host] = LatencyWindow()
+        broken = Mock(**{"get.side_effect": RuntimeError("bad transport")})
+        for attempt in (
+                lambda: get_json(self.base + "/big", max_bytes=10),
+                lambda: get_json(self.base + "/ok", transport=broken)):
+            breaker.record_failure()
+            now[0] += 10
+            self.assertEqual(breaker.state, "half-open")
+            self.assertRaises(Exception, attempt)
+            self.assertIn("hit", get_json(self.base + "/ok"))
+            self.assertEqual(breaker.state, "closed")
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for CircuitBreaker"""
+
+    def test_half_open_trial(self):
+        """Test open -> half-open -> closed/open transitions"""
+        now = [0.0]
+        breaker = CircuitBreaker(2, 10.0, clock=lambda: now[0])
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure()
+        self.assertRaises(CircuitOpenError, breaker.before_call)
+        now[0] = 10.0
+        breaker.before_call()
+        self.assertRaises(CircuitOpenError, breaker.before_call)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        now[0] = 20.0
+        breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""Transports and middleware for ``utils.get_json``.
+
+A transport is anything with a requests-style ``get(url, **kwargs)``
+returning a response with ``status_code``, ``headers``, ``raw``,
+``iter_content`` and ``close`` (the ``requests`` module itself is one).
+Middleware wrap a transport and are transports themselves, so layers
+compose without patching module globals::
+
+    transport = chain(CacheMiddleware, CoalesceMiddleware,
+                      RetryMiddleware, SessionTransport())
+    GithubOrgClient("google", transport=transport).public_repos()
+"""
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+import utils
+from cassette import CassetteResponse
+
+__all__ = [
+    "Response",
+    "Transport",
+    "SessionTransport",
+    "Urllib3Transport",
+    "FixtureTransport",
+    "AsyncTransport",
+    "CacheMiddleware",
+    "CoalesceMiddleware",
+    "RetryMiddleware",
+    "chain",
+]
+
+
+@runtime_checkable
+class Response(Protocol):
+    """What get_json needs from a response"""
+    status_code: int
+    headers: Mapping[str, str]
+    raw: Any
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """Decoded body, chunk by chunk"""
+
+    def close(self) -> None:
+        """Releases the connection"""
+
+
+@runtime_checkable
+class Transport(Protocol):
+    """Sends GET requests; kwargs are requests.get's (timeout, stream,
+    headers)"""
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        """Response to a GET of url"""
+
+
+class SessionTransport:
+    """requests.Session keeping up to pool_size connections per host
+    alive between requests"""
+
+    def __init__(self, session: Optional[requests.Session] = None,
+                 pool_size: int = 10) -> None:
+        """Init method of SessionTransport"""
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size,
+                                  pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """session.get"""
+        return self.session.get(url, **kwargs)
+
+    def close(self) -> None:
+        """Closes the pooled connections"""
+        self.session.close()
+
+
+@contextmanager
+def _requests_errors() -> Iterator[None]:
+    """Re-raises urllib3 errors as the requests exceptions get_json and
+    the middleware understand"""
+    try:
+        yield
+    except urllib3.exceptions.NewConnectionError as exc:
+        raise requests.ConnectionError(exc) from exc
+    except urllib3.exceptions.TimeoutError as exc:
+        raise requests.Timeout(exc) from exc
+    except urllib3.exceptions.HTTPError as exc:
+        raise requests.ConnectionError(exc) from exc
+
+
+class _Urllib3Response:
+    """Requests-style view of a streamed urllib3 response"""
+
+    def __init__(self, response: Any) -> None:
+        """Init method of _Urllib3Response"""
+        self.raw = response
+        self.status_code = response.status
+        self.headers = response.headers
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """Decoded body, chunk by chunk"""
+        with _requests_errors():
+            yield from self.raw.stream(chunk_size, decode_content=True)
+
+    def json(self) -> Any:
+        """Decoded JSON body"""
+        return json.loads(b"".join(self.iter_content(1 << 16)))
+
+    def close(self) -> None:
+        """Returns the connection to the pool"""
+        self.raw.release_conn()
+
+
+class Urllib3Transport:
+    """Direct urllib3.PoolManager transport, skipping requests' own
+    per-request overhead. Retries are left to RetryMiddleware."""
+
+    def __init__(self, pool: Optional[urllib3.PoolManager] = None,
+                 pool_size: int = 10) -> None:
+        """Init method of Urllib3Transport"""
+        self.pool = pool or urllib3.PoolManager(maxsize=pool_size,
+                                                retries=False)
+
+    def get(self, url: str, timeout: Any = None, headers: Any = None,
+            stream: bool = True, **kwargs: Any) -> _Urllib3Response:
+        """GET url, streaming the body"""
+        if isinstance(timeout, tuple):
+            timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        elif timeout is None:
+            timeout = urllib3.Timeout.DEFAULT_TIMEOUT
+        with _requests_errors():
+            return _Urllib3Response(self.pool.request(
+                "GET", url, headers=headers, timeout=timeout,
+                preload_content=False, decode_content=True))
+
+    def close(self) -> None:
+        """Closes the pooled connections"""
+        self.pool.clear()
+
+
+class FixtureTransport:
+    """Serves payloads from memory; unknown URLs get GitHub's 404.
+    Example
+    -------
+    >>> transport = FixtureTransport({url: payload})
+    >>> GithubOrgClient("google", transport=transport).org
+    """
+
+    NOT_FOUND = {"message": "Not Found"}
+
+    def __init__(self, routes: Mapping[str, Any],
+                 statuses: Optional[Mapping[str, int]] = None) -> None:
+        """Init method of FixtureTransport"""
+        self.routes = routes
+        self.statuses = statuses or {}
+        self.requests: List[str] = []
+
+    def get(self, url: str, **kwargs: Any) -> CassetteResponse:
+        """Payload registered for url, JSON-encoded"""
+        self.requests.append(url)
+        if url in self.routes:
+            payload, status = self.routes[url], self.statuses.get(url, 200)
+        else:
+            payload, status = self.NOT_FOUND, 404
+        body = json.dumps(payload).encode()
+        return CassetteResponse(url, status,
+                                {"Content-Type": "application/json"},
+                                body, 0.0, len(body))
+
+
+class AsyncTransport:
+    """Thread-offloading helper for asyncio code, not a Transport:
+    get_json and GithubOrgClient call transports synchronously, so this
+    runs them, and the blocking transport it wraps, in worker threads
+    to keep many requests in flight from one event loop.
+    Example
+    -------
+    >>> helper = AsyncTransport(SessionTransport())
+    >>> org = await helper.get_json(GithubOrgClient.ORG_URL.format(org=o))
+    >>> client = GithubOrgClient(o, transport=helper.transport)
+    >>> repos = await asyncio.to_thread(client.public_repos)
+    """
+
+    def __init__(self, transport: Any = None) -> None:
+        """Init method of AsyncTransport"""
+        self.transport = requests if transport is None else transport
+
+    async def fetch(self, url: str, **kwargs: Any) -> CassetteResponse:
+        """Response to a GET of url, body already read"""
+        def read() -> CassetteResponse:
+            started = time.monotonic()
+            return CassetteResponse.read(
+                url, self.transport.get(url, **kwargs), started)
+        return await asyncio.to_thread(read)
+
+    async def get_json(self, url: str, **kwargs: Any) -> Any:
+        """utils.get_json through the wrapped transport, with its
+        timeouts, breaker and size limits"""
+        return await asyncio.to_thread(
+            utils.get_json, url, transport=self.transport, **kwargs)
+
+
+class CacheMiddleware:
+    """Keeps successful responses for ttl seconds, at most maxsize of
+    them, least recently used evicted first. Bodies are buffered, up to
+    max_bytes (utils.MAX_BYTES by default)."""
+
+    def __init__(self, transport: Any, ttl: float = 60.0,
+                 maxsize: int = 1024,
+                 clock: Callable[[], float] = time.monotonic,
+                 max_bytes: Optional[int] = None) -> None:
+        """Init method of CacheMiddleware"""
+        self.transport = transport
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, CassetteResponse]]" \
+            = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        """Cached response to url, fetched when missing or stale"""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(url)
+                return entry[1]
+        response = CassetteResponse.read(
+            url, self.transport.get(url, **kwargs), time.monotonic(),
+            self.max_bytes)
+        if response.status_code < 400:
+            with self._lock:
+                self._entries[url] = (now + self.ttl, response)
+                self._entries.move_to_end(url)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return response
+
+
+class CoalesceMiddleware:
+    """Concurrent requests for the same URL share one upstream call,
+    whose body is buffered up to max_bytes (utils.MAX_BYTES by
+    default)"""
+
+    def __init__(self, transport: Any,
+                 max_bytes: Optional[int] = None) -> None:
+        """Init method of CoalesceMiddleware"""
+        self.transport = transport
+        self.max_bytes = max_bytes
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> CassetteResponse:
+        """Response to url, joining a request already in flight"""
+        with self._lock:
+            future = self._inflight.get(url)
+            leader = future is None
+            if leader:
+                future = self._inflight[url] = Future()
+        if not leader:
+            return future.result()
+        try:
+            response = CassetteResponse.read(
+                url, self.transport.get(url, **kwargs), time.monotonic(),
+                self.max_bytes)
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._inflight[url]
+
+
+class RetryMiddleware:
+    """Retries connection errors, timeouts and the given statuses up to
+    `retries` times, sleeping backoff * 2 ** attempt in between"""
+
+    def __init__(self, transport: Any, retries: int = 3,
+                 backoff: float = 0.1,
+                 statuses: Sequence[int] = (502, 503, 504),
+                 sleep: Callable[[float], Any] = time.sleep) -> None:
+        """Init method of RetryMiddleware"""
+        self.transport = transport
+        self.retries = retries
+        self.backoff = backoff
+        self.statuses = statuses
+        self.sleep = sleep
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        """Response to url, retried on transient failures"""
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                response = self.transport.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if last:
+                    raise
+            else:
+                if last or response.status_code not in self.statuses:
+                    return response
+                response.close()
+            self.sleep(self.backoff * 2 ** attempt)
+
+
+def chain(*layers: Any) -> Any:
+    """Stacks middleware over the transport given last; layers are
+    listed in the order a request goes through them and are called
+    with the transport beneath (use functools.partial for options)"""
+    *middleware, transport = layers
+    for layer in reversed(middleware):
+        transport = layer(transport)
+    return transport
@@ -1,7 +1,16 @@
 #!/usr/bin/env python3
 """Generic utilities for github org client.
 """
+import json
 import requests
+import threading
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait,
+)
 from functools import wraps
 from typing import (
     Mapping,
@@ -9,14 +18,57 @@ from typing import (
     Any,
     Dict,
     Callable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
 )
+from urllib.parse import urlsplit
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode "br")
+    ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "br, gzip"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip"
 
 __all__ = [
     "access_nested_map",
     "get_json",
     "memoize",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "LatencyWindow",
+    "ResponseTooLargeError",
+    "Transfer",
+    "TransferStats",
+    "TRANSFERS",
 ]
 
+Timeout = Union[float, Tuple[float, float]]
+
+# (connect, read) timeout in seconds of every get_json request
+TIMEOUT: Timeout = (3.05, 10.0)
+# consecutive failures that open a host's circuit, and seconds it stays
+# open before a trial request is let through
+BREAKER_THRESHOLD = 5
+BREAKER_RESET = 30.0
+# send a duplicate request once the first one is slower than the host's
+# p95 latency, measured over the last HEDGE_WINDOW successful requests
+HEDGE = False
+HEDGE_PERCENTILE = 0.95
+HEDGE_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
+# largest decoded body get_json accepts, None for no limit
+MAX_BYTES: Optional[int] = 64 << 20
+CHUNK_SIZE = 16 << 10
+# object whose get(url, **kwargs) returns a requests-like response;
+# None means the requests module itself
+TRANSPORT: Any = None
+
 
 def access_nested_map(nested_map: Mapping, path: Sequence) -> Any:
     """Access nested map with key path.
@@ -40,11 +92,257 @@ def access_nested_map(nested_map: Mapping, path: Sequence) -> Any:
     return nested_map
 
 
-def get_json(url: str) -> Dict:
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of calling a host whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker.
+    After `threshold` consecutive failures the circuit opens and calls
+    fail fast with CircuitOpenError; after `reset_timeout` seconds one
+    trial call is let through, which closes the circuit on success and
+    reopens it on failure.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """Init method of CircuitBreaker"""
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """One of closed, open or half-open"""
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    def before_call(self) -> None:
+        """Raises CircuitOpenError unless a call may go through"""
+        with self._lock:
+            state = self.state
+            if state == "open" or (state == "half-open" and self._trial):
+                raise CircuitOpenError(
+                    "circuit open after {} failures".format(self.failures))
+            self._trial = state == "half-open"
+
+    def release_trial(self) -> None:
+        """Ends a call that proved nothing about the host, letting the
+        next call be the half-open trial instead"""
+        with self._lock:
+            self._trial = False
+
+    def record_success(self) -> None:
+        """Closes the circuit"""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        """Counts a failure, opening the circuit past the threshold"""
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at = self.clock()
+            self._trial = False
+
+
+class LatencyWindow:
+    """Latencies of the last `size` requests, for percentiles"""
+
+    def __init__(self, size: int = 200) -> None:
+        """Init method of LatencyWindow"""
+        self.samples: deque = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        """Records one latency"""
+        self.samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Latency below which `fraction` of the samples fall"""
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_latencies: Dict[str, LatencyWindow] = {}
+_hedge_pool: Optional[ThreadPoolExecutor] = None
+_state_lock = threading.Lock()
+
+
+def _host_state(url: str) -> Tuple[CircuitBreaker, LatencyWindow]:
+    """Breaker and latency window of url's host"""
+    host = urlsplit(url).netloc
+    with _state_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(BREAKER_THRESHOLD,
+                                             BREAKER_RESET)
+            _latencies[host] = LatencyWindow(HEDGE_WINDOW)
+        return _breakers[host], _latencies[host]
+
+
+class ResponseTooLargeError(requests.RequestException):
+    """Raised when a decoded body grows past the size limit"""
+
+
+class Transfer(NamedTuple):
+    """Bytes moved by one request: on the wire and after decoding"""
+    url: str
+    encoding: str
+    wire_bytes: int
+    decoded_bytes: int
+
+
+class TransferStats:
+    """Cumulative transfer counters plus the last Transfer of each
+    thread. Only the response get_json used is counted, not the losing
+    duplicate of a hedged request."""
+
+    def __init__(self) -> None:
+        """Init method of TransferStats"""
+        self.requests = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def record(self, transfer: Transfer) -> None:
+        """Adds transfer to the counters"""
+        with self._lock:
+            self.requests += 1
+            self.wire_bytes += transfer.wire_bytes
+            self.decoded_bytes += transfer.decoded_bytes
+        self._local.last = transfer
+
+    @property
+    def last(self) -> Optional[Transfer]:
+        """Last transfer recorded by the calling thread"""
+        return getattr(self._local, "last", None)
+
+    @property
+    def savings(self) -> float:
+        """Fraction of the decoded bytes compression kept off the wire"""
+        if not self.decoded_bytes:
+            return 0.0
+        return 1 - self.wire_bytes / self.decoded_bytes
+
+
+TRANSFERS = TransferStats()
+
+
+def _read_body(response: Any, max_bytes: Optional[int]) -> Tuple[bytes, int]:
+    """Streams the decoded body, aborting once it passes max_bytes.
+    Returns the body and the number of bytes read off the wire."""
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(CHUNK_SIZE):
+        size += len(chunk)
+        if max_bytes is not None and size > max_bytes:
+            response.close()
+            raise ResponseTooLargeError(
+                "response body exceeds {} bytes".format(max_bytes))
+        chunks.append(chunk)
+    tell = getattr(response.raw, "tell", None)
+    return b"".join(chunks), tell() if tell else size
+
+
+def _fetch(url: str, timeout: Timeout, max_bytes: Optional[int],
+           latencies: LatencyWindow,
+           transport: Any) -> Tuple[Any, bytes, Transfer]:
+    """GETs url, reading the body as it streams in, and records the
+    latency of successful calls"""
+    started = time.monotonic()
+    response = transport.get(url, timeout=timeout, stream=True,
+                             headers={"Accept-Encoding": ACCEPT_ENCODING})
+    try:
+        body, wire_bytes = _read_body(response, max_bytes)
+    finally:
+        response.close()
+    latencies.add(time.monotonic() - started)
+    encoding = response.headers.get("Content-Encoding", "identity")
+    return response, body, Transfer(url, encoding, wire_bytes, len(body))
+
+
+def _hedged_fetch(url: str, timeout: Timeout, max_bytes: Optional[int],
+                  latencies: LatencyWindow,
+                  transport: Any) -> Tuple[Any, bytes, Transfer]:
+    """Sends a second request if the first is slower than the host's
+    p95 latency and returns whichever response arrives first"""
+    global _hedge_pool
+    args = (url, timeout, max_bytes, latencies, transport)
+    if len(latencies.samples) < HEDGE_MIN_SAMPLES:
+        return _fetch(*args)
+    if _hedge_pool is None:
+        with _state_lock:
+            if _hedge_pool is None:
+                _hedge_pool = ThreadPoolExecutor(
+                    thread_name_prefix="get_json-hedge")
+    delay = latencies.percentile(HEDGE_PERCENTILE)
+    pending = {_hedge_pool.submit(_fetch, *args)}
+    done, _ = wait(pending, timeout=delay)
+    if not done:
+        pending.add(_hedge_pool.submit(_fetch, *args))
+    while True:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None or not pending:
+                return future.result()
+
+
+def get_json(url: str, timeout: Optional[Timeout] = None,
+             hedge: Optional[bool] = None,
+             max_bytes: Optional[int] = None,
+             transport: Any = None) -> Dict:
     """Get JSON from remote URL.
+    timeout, hedge, max_bytes and transport default to the module's
+    TIMEOUT, HEDGE, MAX_BYTES (set it to None to lift the limit) and
+    TRANSPORT; a transport is any object with a requests-style
+    get(url, **kwargs), such as a cassette.RecordingTransport.
+    The body is requested compressed (ACCEPT_ENCODING), decoded as it
+    streams in and abandoned with ResponseTooLargeError once it decodes
+    past max_bytes; its wire and decoded sizes go to TRANSFERS.
+    Requests to a host whose circuit breaker is open fail fast with
+    CircuitOpenError; connection errors, timeouts and 5xx responses
+    count as failures, while oversized bodies and other errors count
+    as neither; a body that is not JSON is judged by its status.
     """
-    response = requests.get(url)
-    return response.json()
+    breaker, latencies = _host_state(url)
+    breaker.before_call()
+    timeout = TIMEOUT if timeout is None else timeout
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    if transport is None:
+        transport = requests if TRANSPORT is None else TRANSPORT
+    fetch = _hedged_fetch if (HEDGE if hedge is None else hedge) \
+        else _fetch
+    try:
+        response, body, transfer = fetch(url, timeout, max_bytes,
+                                         latencies, transport)
+    except ResponseTooLargeError:
+        breaker.release_trial()
+        raise
+    except requests.RequestException:
+        breaker.record_failure()
+        raise
+    except BaseException:
+        breaker.release_trial()
+        raise
+    TRANSFERS.record(transfer)
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    try:
+        return json.loads(body)
+    except json.JSONDecodeError as exc:
+        raise requests.JSONDecodeError(exc.msg, exc.doc, exc.pos)
 
 
 def memoize(fn: Callable) -> Callable:
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Importable package layer over the numbered project directories.
+
+The project files (``0-add.py``, ``1-concurrent_coroutines.py``, ...) are
+not valid module names, so each directory gets a proxy module here whose
+attributes are loaded on first access:
+
+>>> from alx_backend_python.variable_annotations import add
+>>> from alx_backend_python import async_function
+>>> async_function.wait_n  # imports 1-concurrent_coroutines only now
+
+Importing the package itself loads none of the project modules.
+"""
+import importlib
+from typing import Any, List
+
+__all__ = [
+    "variable_annotations",
+    "async_function",
+    "async_comprehension",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the proxy submodules on first access"""
+    if name in __all__:
+        return importlib.import_module("{}.{}".format(__name__, name))
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__() -> List[str]:
+    """Lists the lazily loaded submodules"""
+    return sorted(list(globals()) + __all__)
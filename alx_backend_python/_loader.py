@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Lazy attribute loading from the numbered project modules.
+"""
+import importlib
+import os
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_module(directory: str, module: str) -> ModuleType:
+    """Imports `module` (e.g. ``"0-add"``) from the project `directory`.
+
+    The directory is put on ``sys.path`` because the numbered modules
+    import their siblings with ``__import__('0-basic_async_syntax')``;
+    modules are cached under the same names, so mixing this layer with
+    ``__import__`` never loads a file twice.
+    """
+    path = os.path.join(ROOT, directory)
+    if path not in sys.path:
+        sys.path.append(path)
+    return importlib.import_module(module)
+
+
+def lazy_exports(namespace: Dict[str, Any], directory: str,
+                 exports: Dict[str, str]
+                 ) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Builds module-level ``__getattr__``/``__dir__`` (PEP 562) for a
+    proxy module whose `exports` map attribute names to numbered modules.
+    Resolved attributes are stored in `namespace`, so each one costs a
+    dictionary lookup after the first access.
+    """
+    def __getattr__(name: str) -> Any:
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError("module {!r} has no attribute {!r}".format(
+                namespace["__name__"], name)) from None
+        value = getattr(load_module(directory, module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
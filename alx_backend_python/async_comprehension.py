@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""Lazy proxy for 0x02-python_async_comprehension"""
+from alx_backend_python._loader import lazy_exports
+
+_EXPORTS = {
+    "async_generator": "0-async_generator",
+    "async_comprehension": "1-async_comprehension",
+    "measure_runtime": "2-measure_runtime",
+    "async_batch_generator": "3-async_batch_generator",
+    "async_batch_comprehension": "4-async_batch_comprehension",
+}
+__all__ = sorted(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(
+    globals(), "0x02-python_async_comprehension", _EXPORTS)
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""Lazy proxy for 0x01-python_async_function"""
+from alx_backend_python._loader import lazy_exports
+
+_EXPORTS = {
+    "wait_random": "0-basic_async_syntax",
+    "wait_n": "1-concurrent_coroutines",
+    "Histogram": "2-loop_monitor",
+    "LoopMonitor": "2-loop_monitor",
+    "wait_n_sharded": "3-sharded_wait_n",
+    "merge_async": "4-async_merge",
+    "wait_n_stream": "4-async_merge",
+}
+__all__ = sorted(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(
+    globals(), "0x01-python_async_function", _EXPORTS)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Benchmark suite covering the project modules.
+
+Usage::
+
+    python -m alx_backend_python.benchmarks                  # run all
+    python -m alx_backend_python.benchmarks -k memoize       # filter
+    python -m alx_backend_python.benchmarks --save base.json
+    python -m alx_backend_python.benchmarks --compare base.json
+
+Every case is timed best-of-``--repeat``; ``--compare`` exits with
+status 1 when a case is slower than its baseline by more than
+``--threshold`` (a fraction, 0.2 = 20%). The async cases run on
+:class:`VirtualTimeLoop`, so their sleeps cost no wall-clock time.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from alx_backend_python._loader import load_module
+
+UNITTESTS = "0x03-Unittests_and_integration_tests"
+
+CASES: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def case(name: str) -> Callable:
+    """Registers a benchmark: the decorated function does the setup and
+    returns the zero-argument callable that is timed"""
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable:
+        CASES[name] = setup
+        return setup
+    return register
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock jumps to the next timer whenever nothing
+    is ready to run, so asyncio.sleep completes instantly while keeping
+    its ordering.
+
+    This hooks BaseEventLoop internals (_run_once, _ready, _scheduled)
+    as found in CPython 3.11 to 3.13; construction raises RuntimeError
+    on an interpreter without them rather than silently sleeping in
+    real time."""
+
+    def __init__(self) -> None:
+        """Starts the virtual clock at 0"""
+        super().__init__()
+        missing = [name for owner, name in (
+            (asyncio.BaseEventLoop, "_run_once"), (self, "_ready"),
+            (self, "_scheduled")) if not hasattr(owner, name)]
+        if missing:
+            self.close()
+            raise RuntimeError(
+                "VirtualTimeLoop needs asyncio internals missing from "
+                "Python {}: {}".format(sys.version.split()[0],
+                                       ", ".join(missing)))
+        self._virtual_time = 0.0
+
+    def time(self) -> float:
+        """Virtual clock in seconds"""
+        return self._virtual_time
+
+    def _run_once(self) -> None:
+        """Advances the clock to the earliest timer when idle"""
+        if not self._ready and self._scheduled:
+            self._virtual_time = max(self._virtual_time,
+                                     self._scheduled[0].when())
+        super()._run_once()
+
+
+def run_virtual(coro: Any) -> Any:
+    """Runs coro to completion on a fresh VirtualTimeLoop"""
+    with asyncio.Runner(loop_factory=VirtualTimeLoop) as runner:
+        return runner.run(coro)
+
+
+@case("sum_list[1e5]")
+def _sum_list() -> Callable[[], Any]:
+    """sum_list over 1e5 random floats"""
+    sum_list = load_module(
+        "0x00-python_variable_annotations", "5-sum_list").sum_list
+    data = [random.random() for _ in range(10 ** 5)]
+    return lambda: sum_list(data)
+
+
+@case("zoom_array[1e4x3]")
+def _zoom_array() -> Callable[[], Any]:
+    """zoom_array of a 1e4-item tuple by 3"""
+    zoom_array = load_module(
+        "0x00-python_variable_annotations", "102-type_checking").zoom_array
+    data = tuple(range(10 ** 4))
+    return lambda: zoom_array(data, 3)
+
+
+@case("zoom_view[1e4x3] iterate")
+def _zoom_view() -> Callable[[], Any]:
+    """Iterates the lazy zoom_view of a 1e4-item tuple by 3"""
+    zoom_view = load_module(
+        "0x00-python_variable_annotations", "102-type_checking").zoom_view
+    data = tuple(range(10 ** 4))
+    return lambda: sum(1 for _ in zoom_view(data, 3))
+
+
+@case("element_length[1e5]")
+def _element_length() -> Callable[[], Any]:
+    """element_length over 1e5 strings"""
+    element_length = load_module(
+        "0x00-python_variable_annotations", "9-element_length"
+    ).element_length
+    data = ["x" * (i % 50) for i in range(10 ** 5)]
+    return lambda: element_length(data)
+
+
+@case("access_nested_map[depth 10]")
+def _access_nested_map() -> Callable[[], Any]:
+    """access_nested_map down a 10-level dict"""
+    access_nested_map = load_module(UNITTESTS, "utils").access_nested_map
+    path = tuple("k{}".format(i) for i in range(10))
+    nested: Any = 1
+    for key in reversed(path):
+        nested = {key: nested}
+    return lambda: access_nested_map(nested, path)
+
+
+def _memoized_class() -> type:
+    """Fresh class with one memoized property"""
+    memoize = load_module(UNITTESTS, "utils").memoize
+
+    class Memoized:
+        """Holder of the memoized property"""
+        @memoize
+        def value(self) -> int:
+            """Constant answer, computed once per instance"""
+            return 42
+    return Memoized
+
+
+@case("memoize hit")
+def _memoize_hit() -> Callable[[], Any]:
+    """Reads a memoized property already computed"""
+    instance = _memoized_class()()
+    instance.value
+    return lambda: instance.value
+
+
+@case("memoize miss")
+def _memoize_miss() -> Callable[[], Any]:
+    """Reads a memoized property on a fresh instance"""
+    cls = _memoized_class()
+    return lambda: cls().value
+
+
+def _scaled_client(scale: int) -> Any:
+    """GithubOrgClient preloaded with TEST_PAYLOAD repos repeated scale
+    times, so no request is made"""
+    client_module = load_module(UNITTESTS, "client")
+    org, repos = load_module(UNITTESTS, "fixtures").TEST_PAYLOAD[0][:2]
+    client = client_module.GithubOrgClient("google")
+    client._org = org
+    client._repos_payload = repos * scale
+    return client
+
+
+@case("public_repos[x100]")
+def _public_repos() -> Callable[[], Any]:
+    """public_repos over 100 copies of the fixture repos"""
+    client = _scaled_client(100)
+    return lambda: client.public_repos()
+
+
+@case("public_repos[x100] license")
+def _public_repos_license() -> Callable[[], Any]:
+    """public_repos filtered by license over 100 copies of the
+    fixture repos"""
+    client = _scaled_client(100)
+    return lambda: client.public_repos(license="apache-2.0")
+
+
+@case("public_repos[synthetic 1e4] license")
+def _public_repos_synthetic() -> Callable[[], Any]:
+    """public_repos filtered by license over 1e4 generated repos"""
+    generator = load_module(UNITTESTS, "fixtures_generator")
+    client = load_module(UNITTESTS, "client").GithubOrgClient("google")
+    client._org = generator.org_payload("google")
+    client._repos_payload = list(generator.generate_repos(10 ** 4))
+    return lambda: client.public_repos(license="apache-2.0")
+
+
+@case("wait_n[1000, 10] virtual")
+def _wait_n() -> Callable[[], Any]:
+    """wait_n(1000, 10) on the virtual clock"""
+    wait_n = load_module(
+        "0x01-python_async_function", "1-concurrent_coroutines").wait_n
+    return lambda: run_virtual(wait_n(1000, 10))
+
+
+@case("measure_runtime[16] virtual")
+def _measure_runtime() -> Callable[[], Any]:
+    """measure_runtime(16) on the virtual clock"""
+    measure_runtime = load_module(
+        "0x02-python_async_comprehension", "2-measure_runtime"
+    ).measure_runtime
+    return lambda: run_virtual(measure_runtime(16))
+
+
+def time_case(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Best and median seconds per call of fn"""
+    number, _ = timeit.Timer(fn).autorange()
+    samples = sorted(t / number for t in timeit.repeat(
+        fn, number=number, repeat=repeat))
+    return {"best": samples[0], "median": samples[len(samples) // 2],
+            "number": number}
+
+
+def run(names: Sequence[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Sets up and times the named cases"""
+    random.seed(0)
+    return {name: time_case(CASES[name](), repeat) for name in names}
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict],
+            threshold: float) -> List[Tuple[str, float]]:
+    """(case, relative slowdown) for cases past the threshold"""
+    regressions = []
+    for name, result in results.items():
+        if name in baseline:
+            change = result["best"] / baseline[name]["best"] - 1
+            if change > threshold:
+                regressions.append((name, change))
+    return regressions
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="benchmarks for the alx-backend-python modules")
+    parser.add_argument("-k", dest="filter", default="",
+                        help="only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.filter in name]
+    results = run(names, args.repeat)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    for name, result in results.items():
+        line = "{:32} {:12.3f}us".format(name, result["best"] * 1e6)
+        if name in baseline:
+            line += "  {:+.1%}".format(
+                result["best"] / baseline[name]["best"] - 1)
+        print(line)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    regressions = compare(results, baseline, args.threshold)
+    for name, change in regressions:
+        print("REGRESSION {}: {:+.1%}".format(name, change))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark based on ``python -X importtime``.
+
+Usage::
+
+    python -m alx_backend_python.importtime                 # report
+    python -m alx_backend_python.importtime --save base.json
+    python -m alx_backend_python.importtime --compare base.json
+
+``--compare`` exits with status 1 when a statement got slower than the
+baseline by more than ``--tolerance`` (and ``--slack`` microseconds).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from alx_backend_python._loader import ROOT
+
+STATEMENTS = [
+    "pass",
+    "import alx_backend_python",
+    "from alx_backend_python.variable_annotations import add",
+    "from alx_backend_python.variable_annotations import sum_list",
+    "from alx_backend_python.async_function import wait_n",
+    "from alx_backend_python.async_comprehension import measure_runtime",
+]
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) for each ``-X importtime`` line"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure(statement: str, runs: int = 5) -> Dict[str, object]:
+    """Best-of-`runs` total import time of `statement` in a fresh
+    interpreter, with the slowest modules of the best run"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [ROOT, env.get("PYTHONPATH")]))
+    best: Optional[List[Tuple[str, int, int]]] = None
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            env=env, capture_output=True, text=True, check=True)
+        rows = parse_importtime(proc.stderr)
+        if best is None or sum(r[1] for r in rows) < sum(r[1] for r in best):
+            best = rows
+    rows = best or []
+    return {
+        "total_us": sum(r[1] for r in rows),
+        "slowest": sorted(((r[0], r[1]) for r in rows),
+                          key=lambda r: r[1], reverse=True)[:5],
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict],
+            tolerance: float, slack: int) -> List[str]:
+    """Statements whose total_us regressed past the allowed margin"""
+    regressions = []
+    for statement, result in results.items():
+        if statement not in baseline:
+            continue
+        before = baseline[statement]["total_us"]
+        after = result["total_us"]
+        if after > before * (1 + tolerance) + slack:
+            regressions.append("{}: {}us -> {}us".format(
+                statement, before, after))
+    return regressions
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="import-time benchmark for alx_backend_python")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--save", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--slack", type=int, default=2000,
+                        help="absolute noise allowance in microseconds")
+    args = parser.parse_args(argv)
+
+    results = {s: measure(s, args.runs) for s in STATEMENTS}
+    for statement, result in results.items():
+        print("{:>8}us  {}".format(result["total_us"], statement))
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f),
+                                  args.tolerance, args.slack)
+        for line in regressions:
+            print("REGRESSION " + line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
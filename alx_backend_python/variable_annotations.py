@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Lazy proxy for 0x00-python_variable_annotations"""
+from alx_backend_python._loader import lazy_exports
+
+_EXPORTS = {
+    "add": "0-add",
+    "concat": "1-concat",
+    "concat_many": "1-concat",
+    "floor": "2-floor",
+    "to_str": "3-to_str",
+    "to_str_many": "3-to_str",
+    "a": "4-define_variables",
+    "pi": "4-define_variables",
+    "i_understand_annotations": "4-define_variables",
+    "school": "4-define_variables",
+    "sum_list": "5-sum_list",
+    "sum_mixed_list": "6-sum_mixed_list",
+    "to_kv": "7-to_kv",
+    "to_kv_many": "7-to_kv",
+    "square_many": "7-to_kv",
+    "make_multiplier": "8-make_multiplier",
+    "element_length": "9-element_length",
+    "iter_element_length": "9-element_length",
+    "element_length_columnar": "9-element_length",
+    "element_length_chunked": "9-element_length",
+    "safe_first_element": "100-safe_first_element",
+    "first_elements": "100-safe_first_element",
+    "safely_get_value": "101-safely_get_value",
+    "safely_get_many": "101-safely_get_value",
+    "zoom_array": "102-type_checking",
+    "zoom_view": "102-type_checking",
+    "zoom_buffer": "102-type_checking",
+    "ZoomView": "102-type_checking",
+    "fast_sum": "103-sum_engine",
+    "parallel_sum": "103-sum_engine",
+    "type_checked": "105-type_checked",
+    "compile_hint": "105-type_checked",
+    "parallel_map": "106-parallel_map",
+    "map_chunks": "106-parallel_map",
+}
+__all__ = sorted(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(
+    globals(), "0x00-python_variable_annotations", _EXPORTS)